@@ -1,26 +1,30 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import pickle
-from xgboost import XGBClassifier
-from fpdf import FPDF
-import datetime
+import xgboost as xgb
 import os
-import plotly.graph_objects as go
-import plotly.express as px
+import ctypes
+import json
+import hashlib
+from io import BytesIO
 from utils import (
     validate_input,
+    validate_batch,
     create_gauge_chart,
     generate_health_recommendations,
     ReportGenerator,
     VALID_RANGES,
     CATEGORICAL_MAPPINGS,
-    generate_audio_report
+    generate_audio_report,
+    apply_calibration
 )
-from train_model import custom_scaling
-import traceback
-from gtts import gTTS
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Optional: native predictor compiled by train_model.py with Treelite/TL2cgen
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
 
 # Page config
 st.set_page_config(
@@ -43,6 +47,8 @@ if 'input_data' not in st.session_state:
     st.session_state.input_data = None
 if 'audio_generated' not in st.session_state:
     st.session_state.audio_generated = False
+if 'audio_futures' not in st.session_state:
+    st.session_state.audio_futures = {}
 
 # Language configuration
 LANGUAGES = {
@@ -84,27 +90,188 @@ Please fill in your health information below for a personalized risk assessment.
 @st.cache_resource
 def load_model():
     try:
-        with open("xgb_model.pkl", "rb") as f:
-            model = pickle.load(f)
-        with open("scaler.pkl", "rb") as f:
-            scaler = pickle.load(f)
-        return model, scaler
-    except FileNotFoundError:
+        booster = xgb.Booster()
+        booster.load_model("model.ubj")
+        # Models saved without calibration fall back to an identity temperature
+        temperature = float(booster.attr('calibration_temperature') or 1.0)
+        scaler = np.load("scaler.npz")
+        with open("feature_order.json") as f:
+            feature_order = tuple(json.load(f))
+        # Warm up so the first request does not pay one-time predictor setup
+        booster.inplace_predict(np.zeros((1, len(feature_order)), dtype=np.float32))
+        return (
+            booster,
+            temperature,
+            scaler['mean'].astype(np.float32),
+            (1.0 / scaler['scale']).astype(np.float32),
+            feature_order
+        )
+    except (FileNotFoundError, xgb.core.XGBoostError):
         st.error("Model files not found. Please ensure the model is trained first.")
         st.stop()
 
-model, scaler = load_model()
+booster, TEMPERATURE, MEAN, INV_SCALE, FEATURE_ORDER = load_model()
+
+# Single-threaded copy for one-row requests, where OpenMP startup outweighs the work
+@st.cache_resource
+def load_row_booster():
+    row_booster = booster.copy()
+    row_booster.set_param({'nthread': 1})
+    return row_booster
 
-# Load and cache reference data
-@st.cache_data
-def load_reference_data():
+row_booster = load_row_booster()
+
+# Load the compiled predictor when it has been built for this machine
+@st.cache_resource
+def load_predictor():
+    if tl2cgen is None or not os.path.exists("predictor.so"):
+        return None
     try:
-        return pd.read_csv("heart.csv")
-    except FileNotFoundError:
-        st.error("Reference data not found. Please ensure heart.csv exists.")
-        st.stop()
+        predictor = tl2cgen.Predictor("predictor.so")
+        if predictor.num_feature != len(FEATURE_ORDER):
+            return None
+        # predictor.so is not versioned with model.ubj, so only use it if it
+        # reproduces the booster's margins on a few probe rows
+        probe = np.random.default_rng(0).normal(size=(4, len(FEATURE_ORDER))).astype(np.float32)
+        margin = predictor.predict(tl2cgen.DMatrix(probe), pred_margin=True).ravel()
+        expected = booster.inplace_predict(probe, predict_type='margin')
+        if not np.allclose(margin, expected, rtol=1e-4, atol=1e-4):
+            return None
+        return predictor
+    except Exception:
+        return None
+
+predictor = load_predictor()
+
+# Direct entry point into the compiled predictor for single-row requests
+@st.cache_resource
+def load_native_predict():
+    if predictor is None:
+        return None
+    try:
+        lib = ctypes.CDLL(os.path.abspath("predictor.so"))
+        lib.get_threshold_type.restype = ctypes.c_char_p
+        lib.get_leaf_output_type.restype = ctypes.c_char_p
+        lib.get_num_feature.restype = ctypes.c_int32
+        lib.get_num_target.restype = ctypes.c_int32
+        lib.get_num_class.argtypes = [ctypes.c_void_p]
+        lib.get_num_class.restype = None
+        num_class = np.zeros(1, dtype=np.int32)
+        # predict_one hands over a float32 row of len(FEATURE_ORDER) entries and
+        # a single float32 output slot; anything else would read or write past
+        # those buffers
+        if lib.get_threshold_type() != b"float32" or lib.get_leaf_output_type() != b"float32":
+            return None
+        if lib.get_num_feature() != len(FEATURE_ORDER) or lib.get_num_target() != 1:
+            return None
+        lib.get_num_class(num_class.ctypes.data)
+        if num_class[0] != 1:
+            return None
+        lib.predict.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        lib.predict.restype = None
+        return lib.predict
+    except (OSError, AttributeError):
+        return None
+
+native_predict = load_native_predict()
+
+def predict_one(input_data):
+    """
+    Calibrated risk probability for a single input record. Scales the row in
+    place and, when the compiled predictor is loaded, calls it directly
+    without building a DMatrix.
+    """
+    x = np.fromiter(
+        (input_data[k] for k in FEATURE_ORDER),
+        dtype=np.float32,
+        count=len(FEATURE_ORDER)
+    )
+    x -= MEAN
+    x *= INV_SCALE
+    if native_predict is None:
+        return float(predict_risk(x.reshape(1, -1))[0])
+    
+    # The compiled predictor accumulates into the output, so it must start at zero
+    margin = np.zeros(1, dtype=np.float32)
+    native_predict(x.ctypes.data, 1, margin.ctypes.data)
+    return float(apply_calibration(margin[0], TEMPERATURE))
+
+def predict_risk(x):
+    """
+    Calibrated risk probabilities for a scaled float32 feature matrix,
+    using the compiled predictor when available and the booster otherwise.
+    """
+    if predictor is not None:
+        margin = predictor.predict(tl2cgen.DMatrix(x), pred_margin=True).ravel()
+    else:
+        margin = (row_booster if len(x) == 1 else booster).inplace_predict(x, predict_type='margin')
+    return apply_calibration(margin, TEMPERATURE)
+
+# Shared worker pool for gTTS network calls
+@st.cache_resource
+def get_tts_pool():
+    return ThreadPoolExecutor(max_workers=4)
+
+# Hashable form of the recommendations, used as a cache key
+def recommendations_key(recommendations):
+    return tuple(
+        (rec['category'], rec['advice'], tuple(rec['steps']))
+        for rec in recommendations
+    )
+
+def recommendations_from_key(rec_key):
+    return [
+        {'category': category, 'advice': advice, 'steps': list(steps)}
+        for category, advice, steps in rec_key
+    ]
+
+# Short, stable widget-key suffix for a generated file, computed once per file
+def content_key(data):
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+# Cache synthesized audio by everything the spoken text depends on
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def get_audio_report(risk_score, rec_key, language_code):
+    return generate_audio_report(
+        risk_score=risk_score,
+        recommendations=recommendations_from_key(rec_key),
+        language_code=language_code
+    )
 
-df = load_reference_data()
+# Cache the rendered PDF so reruns from other widgets don't rebuild it; the
+# short ttl keeps personal details from lingering in memory after the session
+@st.cache_data(show_spinner=False, max_entries=8, ttl=600)
+def get_pdf_report(input_key, risk_score, rec_key):
+    report_pdf = ReportGenerator().generate_report(
+        dict(input_key),
+        risk_score,
+        recommendations_from_key(rec_key)
+    )
+    return report_pdf, content_key(report_pdf)
+
+# Parse, validate and score an uploaded CSV once per distinct file content.
+# Returns (results, missing_columns); rows that fail the same checks as the
+# form get no risk score
+@st.cache_data(show_spinner=False, max_entries=4)
+def score_batch(csv_bytes):
+    batch_df = pd.read_csv(BytesIO(csv_bytes))
+    missing_columns = [col for col in FEATURE_ORDER if col not in batch_df.columns]
+    if missing_columns:
+        return None, missing_columns
+
+    features = batch_df[list(FEATURE_ORDER)].apply(pd.to_numeric, errors='coerce')
+    valid = validate_batch(features)
+    
+    # Scale the valid rows at once and score them in a single prediction
+    batch = features.to_numpy(dtype=np.float32)[valid]
+    batch -= MEAN
+    batch *= INV_SCALE
+    risk_scores = np.full(len(batch_df), np.nan)
+    if len(batch):
+        risk_scores[valid] = np.round(predict_risk(batch).astype(np.float64) * 100, 1)
+    batch_df['risk_score'] = risk_scores
+    batch_df['valid_input'] = valid
+    return batch_df, []
 
 # Feature mappings
 feature_maps = {
@@ -128,127 +295,74 @@ feature_maps = {
         "Upsloping": 0,
         "Flat": 1,
         "Downsloping": 2
+    },
+    "sex": {
+        "Male": 1,
+        "Female": 0
+    },
+    "yes_no": {
+        "No": 0,
+        "Yes": 1
     }
 }
 
-# Create columns for better layout
-col1, col2 = st.columns(2)
-
-# User inputs
-with col1:
-    st.subheader("📋 Personal Information")
-    user_input = {}
-    
-    age = st.number_input(
-        "Age (years)",
-        min_value=20,
-        max_value=100,
-        value=40,
-        help="Enter your age in years"
-    )
-    user_input['age'] = age
-
-    sex = st.selectbox(
-        "Sex",
-        ["Male", "Female"],
-        help="Select your biological sex"
-    )
-    user_input['sex'] = 1 if sex == "Male" else 0
-
-    cp = st.selectbox(
-        "Chest Pain Type",
-        list(feature_maps['cp'].keys()),
-        help="Select the type of chest pain you experience"
-    )
-    user_input['cp'] = feature_maps['cp'][cp]
-
-with col2:
-    st.subheader("🔬 Medical Measurements")
-    
-    trestbps = st.number_input(
-        "Resting Blood Pressure (mm Hg)",
-        min_value=80,
-        max_value=200,
-        value=120,
-        help="Enter your resting blood pressure"
-    )
-    user_input['trestbps'] = trestbps
-
-    chol = st.number_input(
-        "Serum Cholesterol (mg/dL)",
-        min_value=100,
-        max_value=600,
-        value=200,
-        help="Enter your serum cholesterol level"
-    )
-    user_input['chol'] = chol
-
-    fbs = st.selectbox(
-        "Fasting Blood Sugar > 120 mg/dL",
-        ["No", "Yes"],
-        help="Select if your fasting blood sugar is above 120 mg/dL"
-    )
-    user_input['fbs'] = 1 if fbs == "Yes" else 0
-
-    restecg = st.selectbox(
-        "Resting ECG Results",
-        list(feature_maps['restecg'].keys()),
-        help="Select your resting ECG results"
-    )
-    user_input['restecg'] = feature_maps['restecg'][restecg]
-
-    ca = st.number_input(
-        "Number of Major Vessels (0-3)",
-        min_value=0,
-        max_value=3,
-        value=0,
-        help="Number of major vessels colored by fluoroscopy"
-    )
-    user_input['ca'] = ca
-
-    thal = st.selectbox(
-        "Thalassemia",
-        list(feature_maps['thal'].keys()),
-        help="Select your thalassemia type"
-    )
-    user_input['thal'] = feature_maps['thal'][thal]
-
-# Additional inputs in two columns
-col3, col4 = st.columns(2)
-
-with col3:
-    thalach = st.number_input(
-        "Maximum Heart Rate",
-        min_value=60,
-        max_value=220,
-        value=150,
-        help="Enter your maximum heart rate achieved"
-    )
-    user_input['thalach'] = thalach
-
-    oldpeak = st.number_input(
-        "ST Depression",
-        min_value=0.0,
-        max_value=10.0,
-        value=0.0,
-        help="Enter your ST depression induced by exercise relative to rest"
-    )
-    user_input['oldpeak'] = oldpeak
+# Input schema in model feature order: (widget kind, label, options, help text).
+# Number inputs take st.number_input kwargs; selects map choices to codes.
+INPUT_FIELDS = {
+    'age': ('number', "Age (years)", dict(min_value=20, max_value=100, value=40),
+            "Enter your age in years"),
+    'sex': ('select', "Sex", feature_maps['sex'],
+            "Select your biological sex"),
+    'cp': ('select', "Chest Pain Type", feature_maps['cp'],
+           "Select the type of chest pain you experience"),
+    'trestbps': ('number', "Resting Blood Pressure (mm Hg)", dict(min_value=80, max_value=200, value=120),
+                 "Enter your resting blood pressure"),
+    'chol': ('number', "Serum Cholesterol (mg/dL)", dict(min_value=100, max_value=600, value=200),
+             "Enter your serum cholesterol level"),
+    'fbs': ('select', "Fasting Blood Sugar > 120 mg/dL", feature_maps['yes_no'],
+            "Select if your fasting blood sugar is above 120 mg/dL"),
+    'restecg': ('select', "Resting ECG Results", feature_maps['restecg'],
+                "Select your resting ECG results"),
+    'thalach': ('number', "Maximum Heart Rate", dict(min_value=60, max_value=220, value=150),
+                "Enter your maximum heart rate achieved"),
+    'exang': ('select', "Exercise Induced Angina", feature_maps['yes_no'],
+              "Select if you experience angina due to exercise"),
+    'oldpeak': ('number', "ST Depression", dict(min_value=0.0, max_value=10.0, value=0.0),
+                "Enter your ST depression induced by exercise relative to rest"),
+    'slope': ('select', "ST Slope", feature_maps['slope'],
+              "Select the slope of your peak exercise ST segment"),
+    'ca': ('number', "Number of Major Vessels (0-3)", dict(min_value=0, max_value=3, value=0),
+           "Number of major vessels colored by fluoroscopy"),
+    'thal': ('select', "Thalassemia", feature_maps['thal'],
+             "Select your thalassemia type")
+}
 
-with col4:
-    exang = st.selectbox(
-        "Exercise Induced Angina",
-        ["No", "Yes"],
-        help="Select if you experience angina due to exercise"
+# Two rows of two columns: (subheader, fields) per column
+INPUT_LAYOUT = (
+    (
+        ("📋 Personal Information", ('age', 'sex', 'cp')),
+        ("🔬 Medical Measurements", ('trestbps', 'chol', 'fbs', 'restecg', 'ca', 'thal'))
+    ),
+    (
+        (None, ('thalach', 'oldpeak')),
+        (None, ('exang', 'slope'))
     )
-    user_input['exang'] = 1 if exang == "Yes" else 0
+)
 
-    slope = st.selectbox(
-        "ST Slope",
-        ["Upsloping", "Flat", "Downsloping"],
-        help="Select the slope of your peak exercise ST segment"
-    )
-    user_input['slope'] = feature_maps['slope'][slope]
+def render_input(kind, label, options, help_text):
+    if kind == 'number':
+        return st.number_input(label, help=help_text, **options)
+    return options[st.selectbox(label, list(options), help=help_text)]
+
+# User inputs, keyed in model feature order regardless of layout
+user_input = dict.fromkeys(INPUT_FIELDS)
+for layout_row in INPUT_LAYOUT:
+    for column, (subheader, fields) in zip(st.columns(2), layout_row):
+        with column:
+            if subheader:
+                st.subheader(subheader)
+            for name in fields:
+                user_input[name] = render_input(*INPUT_FIELDS[name])
 
 # Process button
 with st.form("prediction_form"):
@@ -257,50 +371,20 @@ with st.form("prediction_form"):
     if prediction_submitted:
         # Show loading spinner
         with st.spinner("Analyzing your health data and generating risk assessment..."):
-            # Create report generator instance
-            report_gen = ReportGenerator()
-            
-            # Prepare input data
-            input_data = {
-                'age': user_input['age'],
-                'sex': user_input['sex'],
-                'cp': user_input['cp'],
-                'trestbps': user_input['trestbps'],
-                'chol': user_input['chol'],
-                'fbs': user_input['fbs'],
-                'restecg': user_input['restecg'],
-                'thalach': user_input['thalach'],
-                'exang': user_input['exang'],
-                'oldpeak': user_input['oldpeak'],
-                'slope': user_input['slope'],
-                'ca': user_input['ca'],
-                'thal': user_input['thal']
-            }
-            
             try:
-                # Create DataFrame and scale input
-                input_df = pd.DataFrame([input_data])
-                
                 # Validate input data
-                validation_result = validate_input(input_data)
+                validation_result = validate_input(user_input)
                 if not validation_result['valid']:
                     st.error(f"Input validation error: {validation_result['message']}")
                     st.info("Please check your input values and try again.")
                     st.stop()
                     
-                try:
-                    input_scaled = scaler.transform(input_df)
-                except Exception as scaling_error:
-                    st.error(f"Error processing input data: {str(scaling_error)}")
-                    st.info("This might be due to unexpected input format. Please try again.")
-                    st.stop()
-                
                 # Get prediction and probability
                 try:
-                    risk_prob = model.predict_proba(input_scaled)[0][1]
+                    risk_prob = predict_one(user_input)
                     st.session_state.risk_score = risk_prob * 100
-                    st.session_state.recommendations = generate_health_recommendations(input_data, risk_prob)
-                    st.session_state.input_data = input_data  # Store input data for later use
+                    st.session_state.recommendations = generate_health_recommendations(user_input, risk_prob)
+                    st.session_state.input_data = user_input  # Store input data for later use
                 except Exception as prediction_error:
                     st.error(f"Error generating prediction: {str(prediction_error)}")
                     st.info("Please try again or contact support if the issue persists.")
@@ -338,8 +422,12 @@ with st.form("prediction_form"):
                 st.error(f"An unexpected error occurred: {str(e)}")
                 st.info("Please try again or contact support if the issue persists.")
 
+# Report sections run as fragments (Streamlit >= 1.37), so their widgets
+# rerun only their own section instead of the whole script
+
 # Audio Report Section - Completely outside the prediction form
-if st.session_state.risk_score is not None:
+@st.fragment
+def audio_report_section():
     st.markdown("---")
     st.subheader("🔊 Audio Report")
 
@@ -358,46 +446,56 @@ if st.session_state.risk_score is not None:
         # Update session state language
         st.session_state.language = selected_language
         
-        # Generate audio button
+        # Generate audio button - synthesis runs on the shared TTS pool so the
+        # network call survives reruns and several languages can overlap
         if st.button("🎵 Generate Audio Report", key="generate_audio_btn"):
-            try:
-                lang_code = LANGUAGES[selected_language]["code"]
-                
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Generate audio
-                status_text.text("Generating audio report...")
-                progress_bar.progress(25)
-                
-                audio_content = generate_audio_report(
-                    risk_score=st.session_state.risk_score,
-                    recommendations=st.session_state.recommendations,
-                    language_code=lang_code
+            lang_code = LANGUAGES[selected_language]["code"]
+            if lang_code not in st.session_state.audio_futures:
+                st.session_state.audio_futures[lang_code] = get_tts_pool().submit(
+                    get_audio_report,
+                    st.session_state.risk_score,
+                    recommendations_key(st.session_state.recommendations),
+                    lang_code
                 )
+
+        # Collect pending audio jobs as they finish
+        if st.session_state.audio_futures:
+            pending = dict(st.session_state.audio_futures)
+            
+            # Show progress
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            status_text.text("Generating audio report...")
+            
+            succeeded = False
+            for done, future in enumerate(as_completed(pending.values()), start=1):
+                lang_code = next(code for code, f in pending.items() if f is future)
+                lang_name = next((lang['name'] for lang in LANGUAGES.values() if lang['code'] == lang_code), lang_code)
+                del st.session_state.audio_futures[lang_code]
+                progress_bar.progress(int(100 * done / len(pending)))
                 
-                progress_bar.progress(75)
-                status_text.text("Audio generated successfully!")
-                
-                # Store in session state
-                st.session_state.audio_content[lang_code] = audio_content
-                
-                progress_bar.progress(100)
+                try:
+                    # Store in session state
+                    audio_data = future.result()
+                    st.session_state.audio_content[lang_code] = (audio_data, content_key(audio_data))
+                    succeeded = True
+                    
+                    # Show success message
+                    st.success(f"Audio report generated successfully in {lang_name}")
+                except Exception as e:
+                    st.error(f"Error generating audio: {str(e)}")
+                    st.info("This might be due to network connectivity issues. Please try again.")
+            
+            if succeeded:
                 status_text.text("✅ Audio report ready!")
-                
-                # Show success message
-                st.success(f"Audio report generated successfully in {LANGUAGES[selected_language]['name']}")
-                
-            except Exception as e:
-                st.error(f"Error generating audio: {str(e)}")
-                st.info("This might be due to network connectivity issues. Please try again.")
+            else:
+                status_text.empty()
 
     # Display all generated audio reports in a separate container
     if st.session_state.audio_content:
         st.markdown("### 📻 Available Audio Reports")
         
-        for lang_code, audio_data in st.session_state.audio_content.items():
+        for lang_code, (audio_data, audio_key) in st.session_state.audio_content.items():
             lang_name = next((lang['name'] for lang in LANGUAGES.values() if lang['code'] == lang_code), lang_code)
             
             # Create a container for each audio report
@@ -415,14 +513,16 @@ if st.session_state.risk_score is not None:
                         data=audio_data,
                         file_name=f"heart_health_report_{lang_code}.mp3",
                         mime="audio/mp3",
-                        key=f"download_audio_{lang_code}_{hash(audio_data) % 10000}"
+                        key=f"download_audio_{lang_code}_{audio_key}"
                     )
                 
                 st.markdown("---")
     else:
         st.info("No audio reports generated yet. Select a language and click 'Generate Audio Report' above.")
 
-    # Written Report Section
+# Written Report Section
+@st.fragment
+def written_report_section():
     st.markdown("---")
     st.subheader("📄 Written Report")
     
@@ -431,11 +531,10 @@ if st.session_state.risk_score is not None:
     
     with pdf_container:
         try:
-            report_gen = ReportGenerator()
-            report_pdf = report_gen.generate_report(
-                st.session_state.input_data, 
+            report_pdf, pdf_key = get_pdf_report(
+                tuple(st.session_state.input_data.items()),
                 st.session_state.risk_score,
-                st.session_state.recommendations
+                recommendations_key(st.session_state.recommendations)
             )
             
             st.download_button(
@@ -443,11 +542,49 @@ if st.session_state.risk_score is not None:
                 data=report_pdf,
                 file_name="heart_health_report.pdf",
                 mime="application/pdf",
-                key=f"download_pdf_{hash(report_pdf) % 10000}"
+                key=f"download_pdf_{pdf_key}"
             )
         except Exception as e:
             st.error(f"Error generating PDF report: {str(e)}")
 
+if st.session_state.risk_score is not None:
+    audio_report_section()
+    written_report_section()
+
+# Batch Assessment Section - score a whole CSV with one booster call
+st.markdown("---")
+st.subheader("📂 Batch Risk Assessment")
+
+uploaded_file = st.file_uploader(
+    "Upload a CSV of health records",
+    type="csv",
+    help=f"The file must contain the columns: {', '.join(FEATURE_ORDER)}"
+)
+
+if uploaded_file is not None:
+    try:
+        batch_df, missing_columns = score_batch(uploaded_file.getvalue())
+        if missing_columns:
+            st.error(f"Missing columns in uploaded file: {', '.join(missing_columns)}")
+        else:
+            invalid_count = int((~batch_df['valid_input']).sum())
+            if invalid_count:
+                st.warning(
+                    f"{invalid_count} row(s) have missing, out-of-range or invalid values "
+                    "and were not scored (valid_input is False)."
+                )
+
+            st.dataframe(batch_df, use_container_width=True)
+            st.download_button(
+                label="📥 Download Batch Results (CSV)",
+                data=batch_df.to_csv(index=False).encode(),
+                file_name="heart_risk_batch_results.csv",
+                mime="text/csv",
+                key="download_batch_csv"
+            )
+    except Exception as e:
+        st.error(f"Error processing batch file: {str(e)}")
+
 # Footer
 st.markdown("---")
 
@@ -458,6 +595,7 @@ if st.session_state.risk_score is not None:
         st.session_state.risk_score = None
         st.session_state.recommendations = None
         st.session_state.audio_content = {}
+        st.session_state.audio_futures = {}
         st.session_state.input_data = None
         st.rerun()
 
@@ -1,10 +1,12 @@
 import pandas as pd
+import json
+import os
 import numpy as np
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from xgboost import XGBClassifier
-from sklearn.calibration import CalibratedClassifierCV
-import pickle
+from scipy.optimize import minimize_scalar
+from utils import custom_scaling, apply_calibration
 from sklearn.metrics import accuracy_score, classification_report, roc_auc_score, brier_score_loss
 import warnings
 warnings.filterwarnings('ignore')
@@ -15,49 +17,47 @@ def load_and_preprocess_data():
     df = pd.read_csv("heart.csv")
     
     # Add synthetic cases to better represent the full spectrum of risk
-    synthetic_cases = []
+    rng = np.random.default_rng(42)
+    n_cases = 50
     
     # Add very low risk cases (young, healthy individuals)
-    for _ in range(50):
-        synthetic_cases.append({
-            'age': np.random.randint(25, 35),
-            'sex': np.random.choice([0, 1]),
-            'cp': 0,  # Typical angina
-            'trestbps': np.random.randint(110, 120),
-            'chol': np.random.randint(150, 180),
-            'fbs': 0,
-            'restecg': 0,
-            'thalach': np.random.randint(160, 180),
-            'exang': 0,
-            'oldpeak': np.random.uniform(0, 0.2),
-            'slope': 0,
-            'ca': 0,
-            'thal': 1,
-            'target': 0  # Healthy
-        })
+    low_risk_df = pd.DataFrame({
+        'age': rng.integers(25, 35, n_cases),
+        'sex': rng.integers(0, 2, n_cases),
+        'cp': np.zeros(n_cases, dtype=int),  # Typical angina
+        'trestbps': rng.integers(110, 120, n_cases),
+        'chol': rng.integers(150, 180, n_cases),
+        'fbs': np.zeros(n_cases, dtype=int),
+        'restecg': np.zeros(n_cases, dtype=int),
+        'thalach': rng.integers(160, 180, n_cases),
+        'exang': np.zeros(n_cases, dtype=int),
+        'oldpeak': rng.uniform(0, 0.2, n_cases),
+        'slope': np.zeros(n_cases, dtype=int),
+        'ca': np.zeros(n_cases, dtype=int),
+        'thal': np.ones(n_cases, dtype=int),
+        'target': np.zeros(n_cases, dtype=int)  # Healthy
+    })
     
     # Add high risk cases (multiple risk factors)
-    for _ in range(50):
-        synthetic_cases.append({
-            'age': np.random.randint(55, 70),
-            'sex': 1,  # Male (higher risk)
-            'cp': np.random.choice([1, 2, 3]),
-            'trestbps': np.random.randint(140, 180),
-            'chol': np.random.randint(250, 350),
-            'fbs': 1,
-            'restecg': np.random.choice([1, 2]),
-            'thalach': np.random.randint(100, 130),
-            'exang': 1,
-            'oldpeak': np.random.uniform(2.0, 4.0),
-            'slope': np.random.choice([1, 2]),
-            'ca': np.random.choice([2, 3]),
-            'thal': 3,
-            'target': 1  # Disease
-        })
-    
-    # Convert synthetic cases to DataFrame and append to original data
-    synthetic_df = pd.DataFrame(synthetic_cases)
-    df = pd.concat([df, synthetic_df], ignore_index=True)
+    high_risk_df = pd.DataFrame({
+        'age': rng.integers(55, 70, n_cases),
+        'sex': np.ones(n_cases, dtype=int),  # Male (higher risk)
+        'cp': rng.integers(1, 4, n_cases),
+        'trestbps': rng.integers(140, 180, n_cases),
+        'chol': rng.integers(250, 350, n_cases),
+        'fbs': np.ones(n_cases, dtype=int),
+        'restecg': rng.integers(1, 3, n_cases),
+        'thalach': rng.integers(100, 130, n_cases),
+        'exang': np.ones(n_cases, dtype=int),
+        'oldpeak': rng.uniform(2.0, 4.0, n_cases),
+        'slope': rng.integers(1, 3, n_cases),
+        'ca': rng.integers(2, 4, n_cases),
+        'thal': np.full(n_cases, 3, dtype=int),
+        'target': np.ones(n_cases, dtype=int)  # Disease
+    })
+    
+    # Append synthetic cases to original data
+    df = pd.concat([df, low_risk_df, high_risk_df], ignore_index=True)
     
     # Separate features and target
     X = df.drop('target', axis=1)
@@ -75,21 +75,50 @@ def load_and_preprocess_data():
     
     return X_train_scaled, X_test_scaled, y_train, y_test, scaler, df
 
-def custom_scaling(prob):
+def fit_temperature(margin, y):
     """
-    Enhanced scaling function that better reflects true risk levels
-    while maintaining clinical relevance.
+    Fit a single temperature T minimizing the log loss of sigmoid(margin / T)
+    on held-out booster margins.
     """
-    if prob < 0.2:
-        return prob * 0.8  # Slight reduction for very low risk
-    elif prob < 0.4:
-        return prob * 1.0  # Keep as is for low-moderate risk
-    elif prob < 0.6:
-        return prob * 1.2  # Increase for moderate risk
-    elif prob < 0.8:
-        return min(1.0, prob * 1.3)  # Higher increase for high risk
-    else:
-        return min(1.0, prob * 1.4)  # Maximum increase for very high risk
+    y = np.asarray(y)
+    
+    def log_loss(temperature):
+        prob = np.clip(apply_calibration(margin, temperature), 1e-12, 1 - 1e-12)
+        return -np.mean(y * np.log(prob) + (1 - y) * np.log(1 - prob))
+    
+    return float(minimize_scalar(log_loss, bounds=(0.1, 10.0), method='bounded').x)
+
+def remove_predictor(libpath="predictor.so"):
+    """
+    Delete a previously compiled predictor so the app can never load one
+    built from a different model.
+    """
+    try:
+        os.remove(libpath)
+    except FileNotFoundError:
+        pass
+
+def compile_predictor(booster, libpath="predictor.so"):
+    """
+    Compile the tree ensemble into a native shared library with Treelite and
+    TL2cgen. Returns False, leaving no library behind, when the optional
+    compiler packages are missing or compilation fails.
+    """
+    remove_predictor(libpath)
+    try:
+        import treelite
+        import tl2cgen
+    except ImportError:
+        return False
+    
+    try:
+        tl_model = treelite.frontend.from_xgboost(booster)
+        tl2cgen.export_lib(tl_model, toolchain="gcc", libpath=libpath, params={'parallel_comp': 4})
+    except Exception as e:
+        print(f"Compiling predictor failed: {str(e)}")
+        remove_predictor(libpath)
+        return False
+    return True
 
 def train_model():
     """Train an enhanced XGBoost model with optimized parameters."""
@@ -106,22 +135,24 @@ def train_model():
         colsample_bytree=0.8,    # Good feature coverage
         scale_pos_weight=1.2,    # Slight bias towards positive class
         objective='binary:logistic',
+        tree_method='hist',      # Histogram-based split finding
+        n_jobs=-1,               # Use all cores for training and prediction
         random_state=42
     )
     
-    # Create calibrated classifier with sigmoid calibration
-    model = CalibratedClassifierCV(
-        base_model,
-        cv=5,
-        method='sigmoid'
+    # Hold out a calibration slice so a single booster can be calibrated
+    X_fit, X_cal, y_fit, y_cal = train_test_split(
+        X_train_scaled, y_train, test_size=0.2, random_state=42, stratify=y_train
     )
     
-    # Train the model
-    model.fit(X_train_scaled, y_train)
+    # Train the model once and fit temperature scaling on the holdout
+    base_model.fit(X_fit, y_fit)
+    booster = base_model.get_booster()
+    temperature = fit_temperature(booster.inplace_predict(X_cal, predict_type='margin'), y_cal)
     
     # Evaluate model
-    y_pred = model.predict(X_test_scaled)
-    y_prob = model.predict_proba(X_test_scaled)[:, 1]
+    y_prob = apply_calibration(booster.inplace_predict(X_test_scaled, predict_type='margin'), temperature)
+    y_pred = (y_prob >= 0.5).astype(int)
     
     print("\nModel Performance Metrics:")
     print("========================")
@@ -131,14 +162,23 @@ def train_model():
     print("\nClassification Report:")
     print(classification_report(y_test, y_pred))
     
-    # Save model and scaler
-    with open("xgb_model.pkl", "wb") as f:
-        pickle.dump(model, f)
-    with open("scaler.pkl", "wb") as f:
-        pickle.dump(scaler, f)
+    # Save booster (with calibration as attributes) and scaler parameters;
+    # any compiled predictor belongs to the previous model, so drop it first
+    remove_predictor()
+    booster.set_attr(calibration_temperature=repr(temperature))
+    booster.save_model("model.ubj")
+    np.savez("scaler.npz", mean=scaler.mean_, scale=scaler.scale_)
+    with open("feature_order.json", "w") as f:
+        json.dump(list(df.columns.drop('target')), f)
     
     print("\nModel and scaler saved successfully!")
     
+    # Compile a native predictor for faster per-row scoring in the app
+    if compile_predictor(booster):
+        print("Compiled predictor saved to predictor.so")
+    else:
+        print("No compiled predictor built (Treelite/TL2cgen missing or compilation failed)")
+    
     # Test cases
     test_cases = [
         {
@@ -185,7 +225,7 @@ def train_model():
     for case in test_cases:
         test_data = pd.DataFrame([case['data']])
         test_scaled = scaler.transform(test_data)
-        raw_prob = model.predict_proba(test_scaled)[0][1]
+        raw_prob = float(apply_calibration(booster.inplace_predict(test_scaled, predict_type='margin')[0], temperature))
         final_prob = custom_scaling(raw_prob)
         
         print(f"\n{case['name']}:")
@@ -1,16 +1,17 @@
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple, Any
-import plotly.graph_objects as go
+from types import MappingProxyType
+from functools import lru_cache, partial
 from datetime import datetime
-import os
-from fpdf import FPDF
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+import time
+import operator
+import copy
 from io import BytesIO
-from gtts import gTTS
+from xml.sax.saxutils import escape
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Plotting, PDF and TTS libraries are imported inside the functions that use
+# them, so importing utils (e.g. just for validate_input) stays cheap
 
 # Constants for feature ranges and mappings
 FEATURE_RANGES = {
@@ -48,6 +49,12 @@ CATEGORICAL_MAPPINGS = {
     'exang': [0, 1]
 }
 
+# Valid codes per categorical field for O(1) membership checks
+VALID_CODES = {
+    field: frozenset(values.values() if isinstance(values, dict) else values)
+    for field, values in CATEGORICAL_MAPPINGS.items()
+}
+
 # Valid ranges for numerical inputs
 VALID_RANGES = {
     'age': (20, 100),
@@ -58,57 +65,94 @@ VALID_RANGES = {
     'ca': (0, 3)
 }
 
+# Numerical bounds as aligned arrays for vectorized range checks
+RANGE_FIELDS = tuple(VALID_RANGES)
+RANGE_MINS = np.array([min_val for min_val, _ in VALID_RANGES.values()], dtype=np.float64)
+RANGE_MAXS = np.array([max_val for _, max_val in VALID_RANGES.values()], dtype=np.float64)
+
 def validate_input(data):
     """
     Validate user input against predefined ranges and categories.
     """
-    # Check numerical values
+    # Check numerical values; a plain loop beats NumPy for a single record
+    # (validate_batch vectorizes over many)
     for field, (min_val, max_val) in VALID_RANGES.items():
-        if field in data:
-            value = data[field]
-            if not (min_val <= value <= max_val):
-                return {
-                    'valid': False,
-                    'message': f"{field.replace('_', ' ').title()} must be between {min_val} and {max_val}"
-                }
+        if field in data and not (min_val <= data[field] <= max_val):
+            return {
+                'valid': False,
+                'message': f"{field.replace('_', ' ').title()} must be between {min_val} and {max_val}"
+            }
 
     # Check categorical values
-    for field, valid_values in CATEGORICAL_MAPPINGS.items():
-        if field in data:
-            if isinstance(valid_values, dict):
-                # For dictionary mappings (like cp, restecg, slope, thal)
-                if data[field] not in valid_values.values():
-                    return {
-                        'valid': False,
-                        'message': f"Invalid value for {field.replace('_', ' ').title()}"
-                    }
-            elif isinstance(valid_values, list):
-                # For list mappings (like sex, smoking, etc.)
-                if data[field] not in valid_values:
-                    return {
-                        'valid': False,
-                        'message': f"Invalid value for {field.replace('_', ' ').title()}"
-                    }
+    for field, codes in VALID_CODES.items():
+        if field in data and data[field] not in codes:
+            return {
+                'valid': False,
+                'message': f"Invalid value for {field.replace('_', ' ').title()}"
+            }
 
     return {'valid': True, 'message': 'All inputs are valid'}
 
+def validate_batch(records):
+    """
+    Vectorized validate_input for many records at once. records maps every
+    validated field to a numeric column (a DataFrame works); returns a boolean
+    array that is True for valid rows. Missing values (NaN) are invalid.
+    """
+    values = np.column_stack([np.asarray(records[field], dtype=np.float64) for field in RANGE_FIELDS])
+    valid = ((values >= RANGE_MINS) & (values <= RANGE_MAXS)).all(axis=1)
+    for field, codes in VALID_CODES.items():
+        valid &= np.isin(np.asarray(records[field], dtype=np.float64), list(codes))
+    return valid
+
+# Risk band upper bounds and the multiplier applied within each band
+SCALING_BOUNDS = np.array([0.2, 0.4, 0.6, 0.8])
+SCALING_FACTORS = np.array([0.8, 1.0, 1.2, 1.3, 1.4])
+
+def custom_scaling(prob):
+    """
+    Enhanced scaling function that better reflects true risk levels
+    while maintaining clinical relevance.
+    
+    Accepts a scalar or an array of probabilities; arrays are scaled
+    element-wise in a single vectorized pass.
+    """
+    prob = np.asarray(prob, dtype=np.float64)
+    factor = SCALING_FACTORS[np.searchsorted(SCALING_BOUNDS, prob, side='right')]
+    scaled = np.minimum(1.0, prob * factor)
+    return scaled.item() if scaled.ndim == 0 else scaled
+
+def apply_calibration(margin, temperature):
+    """Convert raw booster margins (log-odds) to probabilities at the fitted temperature."""
+    return 1.0 / (1.0 + np.exp(-margin / temperature))
+
+# Gauge styling: risk bands (green/yellow/red), axis and bar
+GAUGE_STEPS = (
+    {'range': [0, 20], 'color': "lightgreen"},
+    {'range': [20, 40], 'color': "yellow"},
+    {'range': [40, 100], 'color': "salmon"}
+)
+GAUGE_AXIS = {'range': [0, 100], 'tickwidth': 1}
+GAUGE_BAR = {'color': "darkblue"}
+
 def create_gauge_chart(risk_score):
     """
     Create a gauge chart visualization for the risk score.
+    
+    Built fresh with full validation on every call: copying a cached
+    validated figure re-validates the whole tree and is slower than this.
     """
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=risk_score * 100,
         domain={'x': [0, 1], 'y': [0, 1]},
         title={'text': "Risk Score", 'font': {'size': 24}},
         gauge={
-            'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 20], 'color': "lightgreen"},
-                {'range': [20, 40], 'color': "yellow"},
-                {'range': [40, 100], 'color': "salmon"}
-            ],
+            'axis': GAUGE_AXIS,
+            'bar': GAUGE_BAR,
+            'steps': GAUGE_STEPS,
             'threshold': {
                 'line': {'color': "red", 'width': 4},
                 'thickness': 0.75,
@@ -117,174 +161,182 @@ def create_gauge_chart(risk_score):
         }
     ))
 
-    fig.update_layout(
-        height=300,
-        margin=dict(l=10, r=10, t=50, b=10),
-        font={'size': 16}
-    )
+    fig.layout.height = 300
+    fig.layout.margin.update(l=10, r=10, t=50, b=10)
+    fig.layout.font.size = 16
 
     return fig
 
+# Conversational audio report text per language code; {score} is filled
+# with the risk score already formatted to one decimal place
+REPORT_TEXTS = MappingProxyType({
+    "en": {
+        "intro": "Hello there! I have your heart health assessment ready. Let me explain what we found in simple terms.",
+        "high_risk": "I need to be very clear with you - your risk score is {score} percent, which is quite high. This means you have a significant chance of developing heart problems. I'm not trying to scare you, but this is serious and you need to take action right away.",
+        "low_risk": "Good news! Your risk score is {score} percent, which is relatively low. This means your heart is in pretty good shape, but there's always room for improvement to keep it that way.",
+        "explanation": "Let me break down what this means for you in everyday terms:",
+        "high_risk_explanation": "Think of your heart like a car engine. Right now, it's showing some warning signs that it might have trouble in the future. This doesn't mean you're having a heart attack right now, but it does mean you need to see a doctor soon to prevent problems.",
+        "low_risk_explanation": "Your heart is working well right now, like a car that's running smoothly. But just like a car needs regular maintenance, your heart needs ongoing care to stay healthy.",
+        "recommendations": "Here's what I recommend you do:",
+        "immediate_action": "Most importantly, if your risk is high, please make an appointment with your doctor or cardiologist as soon as possible. Don't wait - early action can save your life.",
+        "lifestyle_tips": "For your daily life, here are some simple things you can start doing:",
+        "closing": "Remember, this is just a computer assessment to help guide you. Your doctor knows you best and can give you personalized advice. Take care of your heart - it's the only one you've got!",
+        "emergency": "If you experience chest pain, shortness of breath, or feel like something is seriously wrong, call emergency services immediately. Don't wait to see if it gets better."
+    },
+    "es": {
+        "intro": "¡Hola! Tengo tu evaluación de salud cardíaca lista. Déjame explicarte lo que encontramos en términos simples.",
+        "high_risk": "Necesito ser muy claro contigo - tu puntaje de riesgo es {score} por ciento, que es bastante alto. Esto significa que tienes una probabilidad significativa de desarrollar problemas cardíacos. No quiero asustarte, pero esto es serio y necesitas tomar acción inmediatamente.",
+        "low_risk": "¡Buenas noticias! Tu puntaje de riesgo es {score} por ciento, que es relativamente bajo. Esto significa que tu corazón está en bastante buen estado, pero siempre hay espacio para mejorar.",
+        "explanation": "Déjame explicarte lo que esto significa para ti en términos cotidianos:",
+        "high_risk_explanation": "Piensa en tu corazón como el motor de un carro. En este momento, está mostrando algunas señales de advertencia de que podría tener problemas en el futuro. Esto no significa que estés teniendo un ataque cardíaco ahora, pero sí significa que necesitas ver a un doctor pronto para prevenir problemas.",
+        "low_risk_explanation": "Tu corazón está funcionando bien ahora, como un carro que funciona suavemente. Pero así como un carro necesita mantenimiento regular, tu corazón necesita cuidado continuo para mantenerse saludable.",
+        "recommendations": "Aquí está lo que te recomiendo hacer:",
+        "immediate_action": "Lo más importante, si tu riesgo es alto, por favor haz una cita con tu doctor o cardiólogo lo antes posible. No esperes - la acción temprana puede salvar tu vida.",
+        "lifestyle_tips": "Para tu vida diaria, aquí hay algunas cosas simples que puedes empezar a hacer:",
+        "closing": "Recuerda, esto es solo una evaluación computarizada para guiarte. Tu doctor te conoce mejor y puede darte consejos personalizados. Cuida tu corazón - ¡es el único que tienes!",
+        "emergency": "Si experimentas dolor en el pecho, dificultad para respirar, o sientes que algo está seriamente mal, llama a servicios de emergencia inmediatamente. No esperes a ver si mejora."
+    },
+    "fr": {
+        "intro": "Bonjour ! J'ai votre évaluation de santé cardiaque prête. Laissez-moi vous expliquer ce que nous avons trouvé en termes simples.",
+        "high_risk": "Je dois être très clair avec vous - votre score de risque est de {score} pour cent, ce qui est assez élevé. Cela signifie que vous avez une probabilité significative de développer des problèmes cardiaques. Je ne veux pas vous faire peur, mais c'est sérieux et vous devez agir immédiatement.",
+        "low_risk": "Bonne nouvelle ! Votre score de risque est de {score} pour cent, ce qui est relativement faible. Cela signifie que votre cœur est en assez bon état, mais il y a toujours place à l'amélioration.",
+        "explanation": "Laissez-moi vous expliquer ce que cela signifie pour vous en termes quotidiens :",
+        "high_risk_explanation": "Pensez à votre cœur comme au moteur d'une voiture. En ce moment, il montre des signes d'avertissement qu'il pourrait avoir des problèmes à l'avenir. Cela ne signifie pas que vous faites une crise cardiaque maintenant, mais cela signifie que vous devez voir un médecin bientôt pour prévenir les problèmes.",
+        "low_risk_explanation": "Votre cœur fonctionne bien maintenant, comme une voiture qui roule en douceur. Mais comme une voiture a besoin d'entretien régulier, votre cœur a besoin de soins continus pour rester en bonne santé.",
+        "recommendations": "Voici ce que je vous recommande de faire :",
+        "immediate_action": "Le plus important, si votre risque est élevé, veuillez prendre rendez-vous avec votre médecin ou cardiologue dès que possible. N'attendez pas - une action précoce peut sauver votre vie.",
+        "lifestyle_tips": "Pour votre vie quotidienne, voici quelques choses simples que vous pouvez commencer à faire :",
+        "closing": "N'oubliez pas, ceci n'est qu'une évaluation informatique pour vous guider. Votre médecin vous connaît mieux et peut vous donner des conseils personnalisés. Prenez soin de votre cœur - c'est le seul que vous ayez !",
+        "emergency": "Si vous ressentez une douleur thoracique, un essoufflement, ou sentez que quelque chose ne va vraiment pas, appelez immédiatement les services d'urgence. N'attendez pas de voir si cela s'améliore."
+    },
+    "de": {
+        "intro": "Hallo! Ich habe Ihre Herzgesundheitsbewertung bereit. Lassen Sie mich erklären, was wir in einfachen Begriffen gefunden haben.",
+        "high_risk": "Ich muss sehr klar mit Ihnen sein - Ihr Risikoscore beträgt {score} Prozent, was ziemlich hoch ist. Das bedeutet, dass Sie eine erhebliche Wahrscheinlichkeit haben, Herzprobleme zu entwickeln. Ich will Sie nicht erschrecken, aber das ist ernst und Sie müssen sofort handeln.",
+        "low_risk": "Gute Nachrichten! Ihr Risikoscore beträgt {score} Prozent, was relativ niedrig ist. Das bedeutet, dass Ihr Herz in ziemlich gutem Zustand ist, aber es gibt immer Raum für Verbesserungen.",
+        "explanation": "Lassen Sie mich erklären, was das für Sie in alltäglichen Begriffen bedeutet:",
+        "high_risk_explanation": "Denken Sie an Ihr Herz wie an einen Automotor. Im Moment zeigt es einige Warnzeichen, dass es in Zukunft Probleme haben könnte. Das bedeutet nicht, dass Sie jetzt einen Herzinfarkt haben, aber es bedeutet, dass Sie bald einen Arzt aufsuchen müssen, um Probleme zu verhindern.",
+        "low_risk_explanation": "Ihr Herz funktioniert jetzt gut, wie ein Auto, das sanft läuft. Aber wie ein Auto regelmäßige Wartung braucht, braucht Ihr Herz kontinuierliche Pflege, um gesund zu bleiben.",
+        "recommendations": "Hier ist, was ich Ihnen empfehle zu tun:",
+        "immediate_action": "Am wichtigsten ist, wenn Ihr Risiko hoch ist, vereinbaren Sie bitte so schnell wie möglich einen Termin bei Ihrem Arzt oder Kardiologen. Warten Sie nicht - frühes Handeln kann Ihr Leben retten.",
+        "lifestyle_tips": "Für Ihr tägliches Leben, hier sind einige einfache Dinge, die Sie anfangen können zu tun:",
+        "closing": "Denken Sie daran, dies ist nur eine Computerbewertung, um Sie zu führen. Ihr Arzt kennt Sie am besten und kann Ihnen personalisierte Ratschläge geben. Kümmern Sie sich um Ihr Herz - es ist das einzige, das Sie haben!",
+        "emergency": "Wenn Sie Brustschmerzen, Atemnot verspüren oder das Gefühl haben, dass etwas ernsthaft nicht stimmt, rufen Sie sofort den Notdienst an. Warten Sie nicht, um zu sehen, ob es besser wird."
+    },
+    "it": {
+        "intro": "Ciao! Ho la tua valutazione della salute del cuore pronta. Lasciami spiegare cosa abbiamo trovato in termini semplici.",
+        "high_risk": "Devo essere molto chiaro con te - il tuo punteggio di rischio è del {score} percento, che è abbastanza alto. Questo significa che hai una probabilità significativa di sviluppare problemi cardiaci. Non voglio spaventarti, ma questo è serio e devi agire immediatamente.",
+        "low_risk": "Buone notizie! Il tuo punteggio di rischio è del {score} percento, che è relativamente basso. Questo significa che il tuo cuore è in condizioni abbastanza buone, ma c'è sempre spazio per miglioramenti.",
+        "explanation": "Lasciami spiegare cosa significa questo per te in termini quotidiani:",
+        "high_risk_explanation": "Pensa al tuo cuore come al motore di un'auto. In questo momento, sta mostrando alcuni segnali di avvertimento che potrebbe avere problemi in futuro. Questo non significa che stai avendo un attacco di cuore ora, ma significa che devi vedere un medico presto per prevenire problemi.",
+        "low_risk_explanation": "Il tuo cuore sta funzionando bene ora, come un'auto che gira dolcemente. Ma come un'auto ha bisogno di manutenzione regolare, il tuo cuore ha bisogno di cure continue per rimanere sano.",
+        "recommendations": "Ecco cosa ti consiglio di fare:",
+        "immediate_action": "Più importante, se il tuo rischio è alto, per favore fai un appuntamento con il tuo medico o cardiologo il prima possibile. Non aspettare - l'azione precoce può salvare la tua vita.",
+        "lifestyle_tips": "Per la tua vita quotidiana, ecco alcune cose semplici che puoi iniziare a fare:",
+        "closing": "Ricorda, questa è solo una valutazione computerizzata per guidarti. Il tuo medico ti conosce meglio e può darti consigli personalizzati. Prenditi cura del tuo cuore - è l'unico che hai!",
+        "emergency": "Se provi dolore al petto, mancanza di respiro, o senti che qualcosa non va seriamente, chiama immediatamente i servizi di emergenza. Non aspettare di vedere se migliora."
+    },
+    "pt": {
+        "intro": "Olá! Tenho sua avaliação de saúde cardíaca pronta. Deixe-me explicar o que encontramos em termos simples.",
+        "high_risk": "Preciso ser muito claro com você - sua pontuação de risco é de {score} por cento, que é bastante alta. Isso significa que você tem uma probabilidade significativa de desenvolver problemas cardíacos. Não quero assustá-lo, mas isso é sério e você precisa agir imediatamente.",
+        "low_risk": "Boas notícias! Sua pontuação de risco é de {score} por cento, que é relativamente baixa. Isso significa que seu coração está em bastante bom estado, mas sempre há espaço para melhorias.",
+        "explanation": "Deixe-me explicar o que isso significa para você em termos cotidianos:",
+        "high_risk_explanation": "Pense em seu coração como o motor de um carro. Agora, está mostrando alguns sinais de aviso de que pode ter problemas no futuro. Isso não significa que você está tendo um ataque cardíaco agora, mas significa que você precisa ver um médico logo para prevenir problemas.",
+        "low_risk_explanation": "Seu coração está funcionando bem agora, como um carro que funciona suavemente. Mas como um carro precisa de manutenção regular, seu coração precisa de cuidados contínuos para se manter saudável.",
+        "recommendations": "Aqui está o que eu recomendo que você faça:",
+        "immediate_action": "Mais importante, se seu risco é alto, por favor marque uma consulta com seu médico ou cardiologista o mais rápido possível. Não espere - ação precoce pode salvar sua vida.",
+        "lifestyle_tips": "Para sua vida diária, aqui estão algumas coisas simples que você pode começar a fazer:",
+        "closing": "Lembre-se, esta é apenas uma avaliação computadorizada para guiá-lo. Seu médico o conhece melhor e pode dar-lhe conselhos personalizados. Cuide do seu coração - é o único que você tem!",
+        "emergency": "Se você sentir dor no peito, falta de ar, ou sentir que algo está seriamente errado, chame os serviços de emergência imediatamente. Não espere para ver se melhora."
+    },
+    "hi": {
+        "intro": "नमस्ते! मेरे पास आपकी हृदय स्वास्थ्य मूल्यांकन तैयार है। मुझे सरल शब्दों में बताएं कि हमने क्या पाया।",
+        "high_risk": "मुझे आपके साथ बहुत स्पष्ट होना चाहिए - आपका जोखिम स्कोर {score} प्रतिशत है, जो काफी अधिक है। इसका मतलब है कि आपको हृदय की समस्याएं विकसित होने की महत्वपूर्ण संभावना है। मैं आपको डराना नहीं चाहता, लेकिन यह गंभीर है और आपको तुरंत कार्रवाई करने की आवश्यकता है।",
+        "low_risk": "अच्छी खबर! आपका जोखिम स्कोर {score} प्रतिशत है, जो अपेक्षाकृत कम है। इसका मतलब है कि आपका दिल काफी अच्छी स्थिति में है, लेकिन हमेशा सुधार के लिए जगह है।",
+        "explanation": "मुझे आपको रोजमर्रा के शब्दों में समझाएं कि इसका क्या मतलब है:",
+        "high_risk_explanation": "अपने दिल के बारे में सोचें जैसे कार का इंजन। अभी, यह कुछ चेतावनी संकेत दिखा रहा है कि भविष्य में इसे समस्याएं हो सकती हैं। इसका मतलब यह नहीं है कि आपको अभी दिल का दौरा पड़ रहा है, लेकिन इसका मतलब है कि आपको समस्याओं को रोकने के लिए जल्द ही डॉक्टर से मिलने की जरूरत है।",
+        "low_risk_explanation": "आपका दिल अभी अच्छी तरह से काम कर रहा है, जैसे कार जो नरमी से चलती है। लेकिन जैसे कार को नियमित रखरखाव की जरूरत होती है, वैसे ही आपके दिल को स्वस्थ रहने के लिए निरंतर देखभाल की जरूरत होती है।",
+        "recommendations": "यहां मैं आपको क्या करने की सलाह देता हूं:",
+        "immediate_action": "सबसे महत्वपूर्ण, यदि आपका जोखिम अधिक है, तो कृपया जितनी जल्दी हो सके अपने डॉक्टर या कार्डियोलॉजिस्ट से मिलें। इंतजार न करें - जल्दी की कार्रवाई आपकी जान बचा सकती है।",
+        "lifestyle_tips": "आपके दैनिक जीवन के लिए, यहां कुछ सरल चीजें हैं जो आप करना शुरू कर सकते हैं:",
+        "closing": "याद रखें, यह सिर्फ आपको मार्गदर्शन करने के लिए एक कंप्यूटर मूल्यांकन है। आपका डॉक्टर आपको सबसे अच्छी तरह जानता है और आपको व्यक्तिगत सलाह दे सकता है। अपने दिल की देखभाल करें - यही एकमात्र है जो आपके पास है!",
+        "emergency": "यदि आपको छाती में दर्द, सांस लेने में कठिनाई, या लगता है कि कुछ गंभीर रूप से गलत है, तो तुरंत आपातकालीन सेवाओं को बुलाएं। यह देखने के लिए इंतजार न करें कि क्या यह बेहतर होता है।"
+    },
+    "zh-CN": {
+        "intro": "您好！您的心脏健康评估已经准备好了。让我用简单的语言解释我们发现了什么。",
+        "high_risk": "我需要非常清楚地告诉您 - 您的风险评分为{score}%，这相当高。这意味着您有显著的可能性发展心脏病问题。我不想吓唬您，但这很严重，您需要立即采取行动。",
+        "low_risk": "好消息！您的风险评分为{score}%，相对较低。这意味着您的心脏状况相当好，但总有改进的空间。",
+        "explanation": "让我用日常用语解释这对您意味着什么：",
+        "high_risk_explanation": "把您的心脏想象成汽车发动机。现在，它显示了一些警告信号，表明将来可能会有问题。这并不意味着您现在正在心脏病发作，但这确实意味着您需要很快看医生来预防问题。",
+        "low_risk_explanation": "您的心脏现在工作得很好，就像一辆平稳行驶的汽车。但就像汽车需要定期维护一样，您的心脏需要持续护理来保持健康。",
+        "recommendations": "以下是我建议您做的：",
+        "immediate_action": "最重要的是，如果您的风险很高，请尽快与您的医生或心脏病专家预约。不要等待 - 早期行动可以挽救您的生命。",
+        "lifestyle_tips": "对于您的日常生活，以下是一些您可以开始做的简单事情：",
+        "closing": "请记住，这只是为了指导您的计算机评估。您的医生最了解您，可以给您个性化的建议。照顾好您的心脏 - 这是您唯一拥有的！",
+        "emergency": "如果您感到胸痛、呼吸急促，或感觉有什么严重问题，请立即呼叫紧急服务。不要等待看是否好转。"
+    }
+})
+
+def synthesize_speech(text, language_code):
+    """
+    Convert text to MP3 bytes with gTTS. Not cached here; the app caches
+    finished audio reports (with a ttl) in get_audio_report.
+    """
+    from gtts import gTTS
+
+    tts = gTTS(text=text, lang=language_code, slow=False)
+    audio_file = BytesIO()
+    tts.write_to_fp(audio_file)
+    # getvalue() returns the whole buffer regardless of position
+    return audio_file.getvalue()
+
+# Recommendation categories whose first steps are read out in the audio report
+AUDIO_CATEGORIES = frozenset({'Lifestyle Modifications', 'Dietary Guidelines', 'Physical Activity Plan'})
+
 def generate_audio_report(risk_score, recommendations, language_code):
     """
     Generate an audio report in the specified language with human-like, simple explanations.
     """
     try:
-        # Create conversational report text based on language
-        report_texts = {
-            "en": {
-                "intro": "Hello there! I have your heart health assessment ready. Let me explain what we found in simple terms.",
-                "high_risk": "I need to be very clear with you - your risk score is {score:.1f} percent, which is quite high. This means you have a significant chance of developing heart problems. I'm not trying to scare you, but this is serious and you need to take action right away.",
-                "low_risk": "Good news! Your risk score is {score:.1f} percent, which is relatively low. This means your heart is in pretty good shape, but there's always room for improvement to keep it that way.",
-                "explanation": "Let me break down what this means for you in everyday terms:",
-                "high_risk_explanation": "Think of your heart like a car engine. Right now, it's showing some warning signs that it might have trouble in the future. This doesn't mean you're having a heart attack right now, but it does mean you need to see a doctor soon to prevent problems.",
-                "low_risk_explanation": "Your heart is working well right now, like a car that's running smoothly. But just like a car needs regular maintenance, your heart needs ongoing care to stay healthy.",
-                "recommendations": "Here's what I recommend you do:",
-                "immediate_action": "Most importantly, if your risk is high, please make an appointment with your doctor or cardiologist as soon as possible. Don't wait - early action can save your life.",
-                "lifestyle_tips": "For your daily life, here are some simple things you can start doing:",
-                "closing": "Remember, this is just a computer assessment to help guide you. Your doctor knows you best and can give you personalized advice. Take care of your heart - it's the only one you've got!",
-                "emergency": "If you experience chest pain, shortness of breath, or feel like something is seriously wrong, call emergency services immediately. Don't wait to see if it gets better."
-            },
-            "es": {
-                "intro": "¡Hola! Tengo tu evaluación de salud cardíaca lista. Déjame explicarte lo que encontramos en términos simples.",
-                "high_risk": "Necesito ser muy claro contigo - tu puntaje de riesgo es {score:.1f} por ciento, que es bastante alto. Esto significa que tienes una probabilidad significativa de desarrollar problemas cardíacos. No quiero asustarte, pero esto es serio y necesitas tomar acción inmediatamente.",
-                "low_risk": "¡Buenas noticias! Tu puntaje de riesgo es {score:.1f} por ciento, que es relativamente bajo. Esto significa que tu corazón está en bastante buen estado, pero siempre hay espacio para mejorar.",
-                "explanation": "Déjame explicarte lo que esto significa para ti en términos cotidianos:",
-                "high_risk_explanation": "Piensa en tu corazón como el motor de un carro. En este momento, está mostrando algunas señales de advertencia de que podría tener problemas en el futuro. Esto no significa que estés teniendo un ataque cardíaco ahora, pero sí significa que necesitas ver a un doctor pronto para prevenir problemas.",
-                "low_risk_explanation": "Tu corazón está funcionando bien ahora, como un carro que funciona suavemente. Pero así como un carro necesita mantenimiento regular, tu corazón necesita cuidado continuo para mantenerse saludable.",
-                "recommendations": "Aquí está lo que te recomiendo hacer:",
-                "immediate_action": "Lo más importante, si tu riesgo es alto, por favor haz una cita con tu doctor o cardiólogo lo antes posible. No esperes - la acción temprana puede salvar tu vida.",
-                "lifestyle_tips": "Para tu vida diaria, aquí hay algunas cosas simples que puedes empezar a hacer:",
-                "closing": "Recuerda, esto es solo una evaluación computarizada para guiarte. Tu doctor te conoce mejor y puede darte consejos personalizados. Cuida tu corazón - ¡es el único que tienes!",
-                "emergency": "Si experimentas dolor en el pecho, dificultad para respirar, o sientes que algo está seriamente mal, llama a servicios de emergencia inmediatamente. No esperes a ver si mejora."
-            },
-            "fr": {
-                "intro": "Bonjour ! J'ai votre évaluation de santé cardiaque prête. Laissez-moi vous expliquer ce que nous avons trouvé en termes simples.",
-                "high_risk": "Je dois être très clair avec vous - votre score de risque est de {score:.1f} pour cent, ce qui est assez élevé. Cela signifie que vous avez une probabilité significative de développer des problèmes cardiaques. Je ne veux pas vous faire peur, mais c'est sérieux et vous devez agir immédiatement.",
-                "low_risk": "Bonne nouvelle ! Votre score de risque est de {score:.1f} pour cent, ce qui est relativement faible. Cela signifie que votre cœur est en assez bon état, mais il y a toujours place à l'amélioration.",
-                "explanation": "Laissez-moi vous expliquer ce que cela signifie pour vous en termes quotidiens :",
-                "high_risk_explanation": "Pensez à votre cœur comme au moteur d'une voiture. En ce moment, il montre des signes d'avertissement qu'il pourrait avoir des problèmes à l'avenir. Cela ne signifie pas que vous faites une crise cardiaque maintenant, mais cela signifie que vous devez voir un médecin bientôt pour prévenir les problèmes.",
-                "low_risk_explanation": "Votre cœur fonctionne bien maintenant, comme une voiture qui roule en douceur. Mais comme une voiture a besoin d'entretien régulier, votre cœur a besoin de soins continus pour rester en bonne santé.",
-                "recommendations": "Voici ce que je vous recommande de faire :",
-                "immediate_action": "Le plus important, si votre risque est élevé, veuillez prendre rendez-vous avec votre médecin ou cardiologue dès que possible. N'attendez pas - une action précoce peut sauver votre vie.",
-                "lifestyle_tips": "Pour votre vie quotidienne, voici quelques choses simples que vous pouvez commencer à faire :",
-                "closing": "N'oubliez pas, ceci n'est qu'une évaluation informatique pour vous guider. Votre médecin vous connaît mieux et peut vous donner des conseils personnalisés. Prenez soin de votre cœur - c'est le seul que vous ayez !",
-                "emergency": "Si vous ressentez une douleur thoracique, un essoufflement, ou sentez que quelque chose ne va vraiment pas, appelez immédiatement les services d'urgence. N'attendez pas de voir si cela s'améliore."
-            },
-            "de": {
-                "intro": "Hallo! Ich habe Ihre Herzgesundheitsbewertung bereit. Lassen Sie mich erklären, was wir in einfachen Begriffen gefunden haben.",
-                "high_risk": "Ich muss sehr klar mit Ihnen sein - Ihr Risikoscore beträgt {score:.1f} Prozent, was ziemlich hoch ist. Das bedeutet, dass Sie eine erhebliche Wahrscheinlichkeit haben, Herzprobleme zu entwickeln. Ich will Sie nicht erschrecken, aber das ist ernst und Sie müssen sofort handeln.",
-                "low_risk": "Gute Nachrichten! Ihr Risikoscore beträgt {score:.1f} Prozent, was relativ niedrig ist. Das bedeutet, dass Ihr Herz in ziemlich gutem Zustand ist, aber es gibt immer Raum für Verbesserungen.",
-                "explanation": "Lassen Sie mich erklären, was das für Sie in alltäglichen Begriffen bedeutet:",
-                "high_risk_explanation": "Denken Sie an Ihr Herz wie an einen Automotor. Im Moment zeigt es einige Warnzeichen, dass es in Zukunft Probleme haben könnte. Das bedeutet nicht, dass Sie jetzt einen Herzinfarkt haben, aber es bedeutet, dass Sie bald einen Arzt aufsuchen müssen, um Probleme zu verhindern.",
-                "low_risk_explanation": "Ihr Herz funktioniert jetzt gut, wie ein Auto, das sanft läuft. Aber wie ein Auto regelmäßige Wartung braucht, braucht Ihr Herz kontinuierliche Pflege, um gesund zu bleiben.",
-                "recommendations": "Hier ist, was ich Ihnen empfehle zu tun:",
-                "immediate_action": "Am wichtigsten ist, wenn Ihr Risiko hoch ist, vereinbaren Sie bitte so schnell wie möglich einen Termin bei Ihrem Arzt oder Kardiologen. Warten Sie nicht - frühes Handeln kann Ihr Leben retten.",
-                "lifestyle_tips": "Für Ihr tägliches Leben, hier sind einige einfache Dinge, die Sie anfangen können zu tun:",
-                "closing": "Denken Sie daran, dies ist nur eine Computerbewertung, um Sie zu führen. Ihr Arzt kennt Sie am besten und kann Ihnen personalisierte Ratschläge geben. Kümmern Sie sich um Ihr Herz - es ist das einzige, das Sie haben!",
-                "emergency": "Wenn Sie Brustschmerzen, Atemnot verspüren oder das Gefühl haben, dass etwas ernsthaft nicht stimmt, rufen Sie sofort den Notdienst an. Warten Sie nicht, um zu sehen, ob es besser wird."
-            },
-            "it": {
-                "intro": "Ciao! Ho la tua valutazione della salute del cuore pronta. Lasciami spiegare cosa abbiamo trovato in termini semplici.",
-                "high_risk": "Devo essere molto chiaro con te - il tuo punteggio di rischio è del {score:.1f} percento, che è abbastanza alto. Questo significa che hai una probabilità significativa di sviluppare problemi cardiaci. Non voglio spaventarti, ma questo è serio e devi agire immediatamente.",
-                "low_risk": "Buone notizie! Il tuo punteggio di rischio è del {score:.1f} percento, che è relativamente basso. Questo significa che il tuo cuore è in condizioni abbastanza buone, ma c'è sempre spazio per miglioramenti.",
-                "explanation": "Lasciami spiegare cosa significa questo per te in termini quotidiani:",
-                "high_risk_explanation": "Pensa al tuo cuore come al motore di un'auto. In questo momento, sta mostrando alcuni segnali di avvertimento che potrebbe avere problemi in futuro. Questo non significa che stai avendo un attacco di cuore ora, ma significa che devi vedere un medico presto per prevenire problemi.",
-                "low_risk_explanation": "Il tuo cuore sta funzionando bene ora, come un'auto che gira dolcemente. Ma come un'auto ha bisogno di manutenzione regolare, il tuo cuore ha bisogno di cure continue per rimanere sano.",
-                "recommendations": "Ecco cosa ti consiglio di fare:",
-                "immediate_action": "Più importante, se il tuo rischio è alto, per favore fai un appuntamento con il tuo medico o cardiologo il prima possibile. Non aspettare - l'azione precoce può salvare la tua vita.",
-                "lifestyle_tips": "Per la tua vita quotidiana, ecco alcune cose semplici che puoi iniziare a fare:",
-                "closing": "Ricorda, questa è solo una valutazione computerizzata per guidarti. Il tuo medico ti conosce meglio e può darti consigli personalizzati. Prenditi cura del tuo cuore - è l'unico che hai!",
-                "emergency": "Se provi dolore al petto, mancanza di respiro, o senti che qualcosa non va seriamente, chiama immediatamente i servizi di emergenza. Non aspettare di vedere se migliora."
-            },
-            "pt": {
-                "intro": "Olá! Tenho sua avaliação de saúde cardíaca pronta. Deixe-me explicar o que encontramos em termos simples.",
-                "high_risk": "Preciso ser muito claro com você - sua pontuação de risco é de {score:.1f} por cento, que é bastante alta. Isso significa que você tem uma probabilidade significativa de desenvolver problemas cardíacos. Não quero assustá-lo, mas isso é sério e você precisa agir imediatamente.",
-                "low_risk": "Boas notícias! Sua pontuação de risco é de {score:.1f} por cento, que é relativamente baixa. Isso significa que seu coração está em bastante bom estado, mas sempre há espaço para melhorias.",
-                "explanation": "Deixe-me explicar o que isso significa para você em termos cotidianos:",
-                "high_risk_explanation": "Pense em seu coração como o motor de um carro. Agora, está mostrando alguns sinais de aviso de que pode ter problemas no futuro. Isso não significa que você está tendo um ataque cardíaco agora, mas significa que você precisa ver um médico logo para prevenir problemas.",
-                "low_risk_explanation": "Seu coração está funcionando bem agora, como um carro que funciona suavemente. Mas como um carro precisa de manutenção regular, seu coração precisa de cuidados contínuos para se manter saudável.",
-                "recommendations": "Aqui está o que eu recomendo que você faça:",
-                "immediate_action": "Mais importante, se seu risco é alto, por favor marque uma consulta com seu médico ou cardiologista o mais rápido possível. Não espere - ação precoce pode salvar sua vida.",
-                "lifestyle_tips": "Para sua vida diária, aqui estão algumas coisas simples que você pode começar a fazer:",
-                "closing": "Lembre-se, esta é apenas uma avaliação computadorizada para guiá-lo. Seu médico o conhece melhor e pode dar-lhe conselhos personalizados. Cuide do seu coração - é o único que você tem!",
-                "emergency": "Se você sentir dor no peito, falta de ar, ou sentir que algo está seriamente errado, chame os serviços de emergência imediatamente. Não espere para ver se melhora."
-            },
-            "hi": {
-                "intro": "नमस्ते! मेरे पास आपकी हृदय स्वास्थ्य मूल्यांकन तैयार है। मुझे सरल शब्दों में बताएं कि हमने क्या पाया।",
-                "high_risk": "मुझे आपके साथ बहुत स्पष्ट होना चाहिए - आपका जोखिम स्कोर {score:.1f} प्रतिशत है, जो काफी अधिक है। इसका मतलब है कि आपको हृदय की समस्याएं विकसित होने की महत्वपूर्ण संभावना है। मैं आपको डराना नहीं चाहता, लेकिन यह गंभीर है और आपको तुरंत कार्रवाई करने की आवश्यकता है।",
-                "low_risk": "अच्छी खबर! आपका जोखिम स्कोर {score:.1f} प्रतिशत है, जो अपेक्षाकृत कम है। इसका मतलब है कि आपका दिल काफी अच्छी स्थिति में है, लेकिन हमेशा सुधार के लिए जगह है।",
-                "explanation": "मुझे आपको रोजमर्रा के शब्दों में समझाएं कि इसका क्या मतलब है:",
-                "high_risk_explanation": "अपने दिल के बारे में सोचें जैसे कार का इंजन। अभी, यह कुछ चेतावनी संकेत दिखा रहा है कि भविष्य में इसे समस्याएं हो सकती हैं। इसका मतलब यह नहीं है कि आपको अभी दिल का दौरा पड़ रहा है, लेकिन इसका मतलब है कि आपको समस्याओं को रोकने के लिए जल्द ही डॉक्टर से मिलने की जरूरत है।",
-                "low_risk_explanation": "आपका दिल अभी अच्छी तरह से काम कर रहा है, जैसे कार जो नरमी से चलती है। लेकिन जैसे कार को नियमित रखरखाव की जरूरत होती है, वैसे ही आपके दिल को स्वस्थ रहने के लिए निरंतर देखभाल की जरूरत होती है।",
-                "recommendations": "यहां मैं आपको क्या करने की सलाह देता हूं:",
-                "immediate_action": "सबसे महत्वपूर्ण, यदि आपका जोखिम अधिक है, तो कृपया जितनी जल्दी हो सके अपने डॉक्टर या कार्डियोलॉजिस्ट से मिलें। इंतजार न करें - जल्दी की कार्रवाई आपकी जान बचा सकती है।",
-                "lifestyle_tips": "आपके दैनिक जीवन के लिए, यहां कुछ सरल चीजें हैं जो आप करना शुरू कर सकते हैं:",
-                "closing": "याद रखें, यह सिर्फ आपको मार्गदर्शन करने के लिए एक कंप्यूटर मूल्यांकन है। आपका डॉक्टर आपको सबसे अच्छी तरह जानता है और आपको व्यक्तिगत सलाह दे सकता है। अपने दिल की देखभाल करें - यही एकमात्र है जो आपके पास है!",
-                "emergency": "यदि आपको छाती में दर्द, सांस लेने में कठिनाई, या लगता है कि कुछ गंभीर रूप से गलत है, तो तुरंत आपातकालीन सेवाओं को बुलाएं। यह देखने के लिए इंतजार न करें कि क्या यह बेहतर होता है।"
-            },
-            "zh-CN": {
-                "intro": "您好！您的心脏健康评估已经准备好了。让我用简单的语言解释我们发现了什么。",
-                "high_risk": "我需要非常清楚地告诉您 - 您的风险评分为{score:.1f}%，这相当高。这意味着您有显著的可能性发展心脏病问题。我不想吓唬您，但这很严重，您需要立即采取行动。",
-                "low_risk": "好消息！您的风险评分为{score:.1f}%，相对较低。这意味着您的心脏状况相当好，但总有改进的空间。",
-                "explanation": "让我用日常用语解释这对您意味着什么：",
-                "high_risk_explanation": "把您的心脏想象成汽车发动机。现在，它显示了一些警告信号，表明将来可能会有问题。这并不意味着您现在正在心脏病发作，但这确实意味着您需要很快看医生来预防问题。",
-                "low_risk_explanation": "您的心脏现在工作得很好，就像一辆平稳行驶的汽车。但就像汽车需要定期维护一样，您的心脏需要持续护理来保持健康。",
-                "recommendations": "以下是我建议您做的：",
-                "immediate_action": "最重要的是，如果您的风险很高，请尽快与您的医生或心脏病专家预约。不要等待 - 早期行动可以挽救您的生命。",
-                "lifestyle_tips": "对于您的日常生活，以下是一些您可以开始做的简单事情：",
-                "closing": "请记住，这只是为了指导您的计算机评估。您的医生最了解您，可以给您个性化的建议。照顾好您的心脏 - 这是您唯一拥有的！",
-                "emergency": "如果您感到胸痛、呼吸急促，或感觉有什么严重问题，请立即呼叫紧急服务。不要等待看是否好转。"
-            }
-        }
-
         # Use English as fallback if language not available
-        texts = report_texts.get(language_code, report_texts['en'])
+        texts = REPORT_TEXTS.get(language_code, REPORT_TEXTS['en'])
+        score = {'score': f"{risk_score:.1f}"}
         
         # Build the conversational report text
-        report_text = texts['intro'] + " "
+        parts = [texts['intro'], " "]
         
         if risk_score > 50:
-            report_text += texts['high_risk'].format(score=risk_score) + " "
-            report_text += texts['explanation'] + " "
-            report_text += texts['high_risk_explanation'] + " "
+            parts += [texts['high_risk'].format_map(score), " ",
+                      texts['explanation'], " ",
+                      texts['high_risk_explanation'], " "]
         else:
-            report_text += texts['low_risk'].format(score=risk_score) + " "
-            report_text += texts['explanation'] + " "
-            report_text += texts['low_risk_explanation'] + " "
+            parts += [texts['low_risk'].format_map(score), " ",
+                      texts['explanation'], " ",
+                      texts['low_risk_explanation'], " "]
         
         # Add immediate action advice
-        report_text += texts['recommendations'] + " "
+        parts += [texts['recommendations'], " "]
         if risk_score > 50:
-            report_text += texts['immediate_action'] + " "
-            report_text += texts['emergency'] + " "
+            parts += [texts['immediate_action'], " ", texts['emergency'], " "]
         
         # Add lifestyle recommendations in simple terms
-        report_text += texts['lifestyle_tips'] + " "
+        parts += [texts['lifestyle_tips'], " "]
         for rec in recommendations:
-            if rec['category'] in ['Lifestyle Modifications', 'Dietary Guidelines', 'Physical Activity Plan']:
+            if rec['category'] in AUDIO_CATEGORIES:
                 for step in rec['steps'][:2]:  # Limit to top 2 steps per category for brevity
-                    report_text += step + ". "
+                    parts += [step, ". "]
         
         # Add closing message
-        report_text += " " + texts['closing']
+        parts += [" ", texts['closing']]
+        report_text = "".join(parts)
 
         # Generate audio using gTTS with error handling
         try:
-            tts = gTTS(text=report_text, lang=language_code, slow=False)
-            audio_file = BytesIO()
-            tts.write_to_fp(audio_file)
-            audio_file.seek(0)
-            return audio_file.getvalue()
+            return synthesize_speech(report_text, language_code)
         except Exception as e:
             # Try with a fallback language if the requested language fails
             if language_code != "en":
                 try:
-                    tts = gTTS(text=report_text, lang="en", slow=False)
-                    audio_file = BytesIO()
-                    tts.write_to_fp(audio_file)
-                    audio_file.seek(0)
-                    return audio_file.getvalue()
+                    return synthesize_speech(report_text, "en")
                 except Exception as fallback_error:
                     raise Exception(f"Failed to generate audio in both {language_code} and English: {str(e)} -> {str(fallback_error)}")
             else:
@@ -293,9 +345,125 @@ def generate_audio_report(risk_score, recommendations, language_code):
     except Exception as e:
         raise Exception(f"Error preparing audio report: {str(e)}")
 
-def generate_health_recommendations(user_input, risk_score):
+def generate_audio_reports_multi(risk_score, recommendations, language_codes):
+    """
+    Generate audio reports for several languages at once.
+
+    Speech synthesis is network-bound, so the languages are fetched in
+    parallel threads. Returns a dict of language code to MP3 bytes.
+    """
+    language_codes = list(language_codes)
+    if not language_codes:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(language_codes))) as executor:
+        reports = executor.map(
+            lambda code: generate_audio_report(risk_score, recommendations, code),
+            language_codes
+        )
+        return dict(zip(language_codes, reports))
+
+# Steps for the high-risk and lower-risk recommendation cards
+HIGH_RISK_STEPS = (
+    "Schedule an appointment with a cardiologist within the next week",
+    "Begin monitoring your blood pressure daily and keep a log",
+    "Start keeping a detailed health diary of any symptoms",
+    "Review your current medications with your doctor",
+    "Consider scheduling a stress test evaluation",
+    "Have an emergency contact plan ready"
+)
+
+PREVENTIVE_STEPS = (
+    "Schedule regular check-ups with your primary care physician",
+    "Maintain a consistent exercise routine",
+    "Keep tracking your blood pressure periodically",
+    "Focus on heart-healthy dietary choices",
+    "Stay up to date with your health screenings"
+)
+
+# General lifestyle tips used when no LIFESTYLE_RULES threshold fires
+GENERAL_LIFESTYLE_STEPS = (
+    "Aim for 7-8 hours of quality sleep each night",
+    "Practice stress management techniques regularly",
+    "Maintain a healthy weight through balanced diet and exercise",
+    "Avoid smoking and limit exposure to secondhand smoke"
+)
+
+# Dietary guidelines shown to everyone
+DIET_STEPS = (
+    "Eat a variety of colorful fruits and vegetables daily (aim for 5-7 servings)",
+    "Choose whole grains over refined grains (brown rice, whole wheat bread)",
+    "Select lean proteins like fish, chicken, and plant-based options",
+    "Limit processed foods and added sugars",
+    "Stay hydrated with water throughout the day (aim for 8 glasses)",
+    "Use healthy cooking methods like grilling, baking, or steaming"
+)
+
+# Physical activity plans for high and lower risk
+HIGH_RISK_EXERCISE_STEPS = (
+    "Begin with supervised exercise sessions under medical guidance",
+    "Start with short, low-intensity walks (5-10 minutes)",
+    "Gradually increase activity as approved by your doctor",
+    "Monitor your heart rate during exercise",
+    "Stop activity immediately if you experience chest pain or shortness of breath",
+    "Consider joining a cardiac rehabilitation program"
+)
+
+EXERCISE_STEPS = (
+    "Aim for 150 minutes of moderate activity weekly (30 minutes, 5 days/week)",
+    "Include both cardio and strength training in your routine",
+    "Try activities like brisk walking, swimming, or cycling",
+    "Exercise with a partner when possible for motivation and safety",
+    "Track your progress with a fitness app or journal",
+    "Make exercise a fun part of your daily routine"
+)
+
+# Lifestyle rules: (field, comparison, threshold, steps added when it holds)
+LIFESTYLE_RULES = (
+    ('trestbps', operator.gt, 130, (
+        "Reduce sodium intake to less than 2,300mg daily (about 1 teaspoon of salt)",
+        "Practice stress-reduction techniques like deep breathing or meditation",
+        "Consider following the DASH diet approach for blood pressure control",
+        "Limit alcohol consumption to moderate levels"
+    )),
+    ('chol', operator.gt, 200, (
+        "Increase consumption of omega-3 rich foods like fatty fish",
+        "Reduce saturated fat intake from red meat and dairy",
+        "Add more fiber to your diet through whole grains and vegetables",
+        "Consider adding plant sterols to your diet"
+    )),
+    ('thalach', operator.lt, 150, (
+        "Start a graduated exercise program approved by your doctor",
+        "Consider cardiac rehabilitation if recommended",
+        "Focus on aerobic exercises like walking, swimming, or cycling",
+        "Build up your exercise tolerance gradually"
+    )),
+    ('exang', operator.eq, 1, (
+        "Work with a physical therapist for safe exercise planning",
+        "Learn to recognize exercise-related warning signs",
+        "Keep nitroglycerin handy if prescribed by your doctor",
+        "Avoid exercising in extreme temperatures"
+    ))
+)
+
+def lifestyle_rule_masks(records):
+    """
+    Evaluate LIFESTYLE_RULES for a whole cohort at once.
+
+    records maps each rule field to an array of values (a DataFrame works).
+    Returns an int64 array where bit i is set when rule i fired for that row.
+    """
+    masks = None
+    for bit, (field, compare, threshold, _) in enumerate(LIFESTYLE_RULES):
+        fired = compare(np.asarray(records[field]), threshold).astype(np.int64) << bit
+        masks = fired if masks is None else masks | fired
+    return masks
+
+def generate_health_recommendations(user_input, risk_score, rule_mask=None):
     """
     Generate personalized health recommendations based on user input and risk score.
+
+    rule_mask is an optional precomputed entry from lifestyle_rule_masks; when
+    given, the lifestyle thresholds are not re-evaluated.
     """
     recommendations = []
     
@@ -304,26 +472,13 @@ def generate_health_recommendations(user_input, risk_score):
         risk_rec = {
             'category': '🚨 Immediate Actions Required',
             'advice': 'Please take these steps as soon as possible to protect your heart health:',
-            'steps': [
-                "Schedule an appointment with a cardiologist within the next week",
-                "Begin monitoring your blood pressure daily and keep a log",
-                "Start keeping a detailed health diary of any symptoms",
-                "Review your current medications with your doctor",
-                "Consider scheduling a stress test evaluation",
-                "Have an emergency contact plan ready"
-            ]
+            'steps': list(HIGH_RISK_STEPS)
         }
     else:  # Lower risk
         risk_rec = {
             'category': '✅ Preventive Measures',
             'advice': 'Great job! Here are some steps to keep your heart healthy:',
-            'steps': [
-                "Schedule regular check-ups with your primary care physician",
-                "Maintain a consistent exercise routine",
-                "Keep tracking your blood pressure periodically",
-                "Focus on heart-healthy dietary choices",
-                "Stay up to date with your health screenings"
-            ]
+            'steps': list(PREVENTIVE_STEPS)
         }
     recommendations.append(risk_rec)
     
@@ -334,46 +489,17 @@ def generate_health_recommendations(user_input, risk_score):
         'steps': []
     }
     
-    if user_input['trestbps'] > 130:
-        lifestyle_rec['steps'].extend([
-            "Reduce sodium intake to less than 2,300mg daily (about 1 teaspoon of salt)",
-            "Practice stress-reduction techniques like deep breathing or meditation",
-            "Consider following the DASH diet approach for blood pressure control",
-            "Limit alcohol consumption to moderate levels"
-        ])
-    
-    if user_input['chol'] > 200:
-        lifestyle_rec['steps'].extend([
-            "Increase consumption of omega-3 rich foods like fatty fish",
-            "Reduce saturated fat intake from red meat and dairy",
-            "Add more fiber to your diet through whole grains and vegetables",
-            "Consider adding plant sterols to your diet"
-        ])
-    
-    if user_input['thalach'] < 150:
-        lifestyle_rec['steps'].extend([
-            "Start a graduated exercise program approved by your doctor",
-            "Consider cardiac rehabilitation if recommended",
-            "Focus on aerobic exercises like walking, swimming, or cycling",
-            "Build up your exercise tolerance gradually"
-        ])
-    
-    if user_input['exang'] == 1:
-        lifestyle_rec['steps'].extend([
-            "Work with a physical therapist for safe exercise planning",
-            "Learn to recognize exercise-related warning signs",
-            "Keep nitroglycerin handy if prescribed by your doctor",
-            "Avoid exercising in extreme temperatures"
-        ])
+    for bit, (field, compare, threshold, steps) in enumerate(LIFESTYLE_RULES):
+        if rule_mask is None:
+            fired = compare(user_input[field], threshold)
+        else:
+            fired = rule_mask >> bit & 1
+        if fired:
+            lifestyle_rec['steps'].extend(steps)
     
     # Add general lifestyle tips if no specific conditions
     if not lifestyle_rec['steps']:
-        lifestyle_rec['steps'].extend([
-            "Aim for 7-8 hours of quality sleep each night",
-            "Practice stress management techniques regularly",
-            "Maintain a healthy weight through balanced diet and exercise",
-            "Avoid smoking and limit exposure to secondhand smoke"
-        ])
+        lifestyle_rec['steps'].extend(GENERAL_LIFESTYLE_STEPS)
     
     recommendations.append(lifestyle_rec)
     
@@ -381,14 +507,7 @@ def generate_health_recommendations(user_input, risk_score):
     diet_rec = {
         'category': '🥗 Dietary Guidelines',
         'advice': 'Your diet plays a crucial role in heart health. Here are some simple guidelines:',
-        'steps': [
-            "Eat a variety of colorful fruits and vegetables daily (aim for 5-7 servings)",
-            "Choose whole grains over refined grains (brown rice, whole wheat bread)",
-            "Select lean proteins like fish, chicken, and plant-based options",
-            "Limit processed foods and added sugars",
-            "Stay hydrated with water throughout the day (aim for 8 glasses)",
-            "Use healthy cooking methods like grilling, baking, or steaming"
-        ]
+        'steps': list(DIET_STEPS)
     }
     recommendations.append(diet_rec)
     
@@ -400,209 +519,352 @@ def generate_health_recommendations(user_input, risk_score):
     }
     
     if risk_score > 0.5:
-        exercise_rec['steps'].extend([
-            "Begin with supervised exercise sessions under medical guidance",
-            "Start with short, low-intensity walks (5-10 minutes)",
-            "Gradually increase activity as approved by your doctor",
-            "Monitor your heart rate during exercise",
-            "Stop activity immediately if you experience chest pain or shortness of breath",
-            "Consider joining a cardiac rehabilitation program"
-        ])
+        exercise_rec['steps'].extend(HIGH_RISK_EXERCISE_STEPS)
     else:
-        exercise_rec['steps'].extend([
-            "Aim for 150 minutes of moderate activity weekly (30 minutes, 5 days/week)",
-            "Include both cardio and strength training in your routine",
-            "Try activities like brisk walking, swimming, or cycling",
-            "Exercise with a partner when possible for motivation and safety",
-            "Track your progress with a fitness app or journal",
-            "Make exercise a fun part of your daily routine"
-        ])
+        exercise_rec['steps'].extend(EXERCISE_STEPS)
     
     recommendations.append(exercise_rec)
     
     return recommendations
 
+@lru_cache(maxsize=1)
+def format_report_minute(minute):
+    return datetime.fromtimestamp(minute * 60).strftime('%B %d, %Y at %I:%M %p')
+
+def report_timestamp():
+    """
+    Current time formatted for the report header. The format has minute
+    resolution, so strftime runs at most once per wall-clock minute.
+    """
+    return format_report_minute(int(time.time() // 60))
+
+@lru_cache(maxsize=None)
+def get_report_styles():
+    """
+    Build the report paragraph styles once per process and share them
+    across ReportGenerator instances.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=12
+    )
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=12
+    )
+    high_risk_style = ParagraphStyle(
+        'HighRisk',
+        parent=body_style,
+        textColor='red',
+        fontSize=14
+    )
+    low_risk_style = ParagraphStyle(
+        'LowRisk',
+        parent=body_style,
+        textColor='green',
+        fontSize=14
+    )
+    return title_style, heading_style, body_style, high_risk_style, low_risk_style
+
+# Health information rows in the PDF report, in display order:
+# (input key, label, readable names for coded values or None)
+YES_NO_LABELS = {0: 'No', 1: 'Yes'}
+DISPLAY_FIELDS = (
+    ('age', 'Age', None),
+    ('sex', 'Sex', {0: 'Female', 1: 'Male'}),
+    ('cp', 'Chest Pain Type', {0: 'Typical Angina', 1: 'Atypical Angina', 2: 'Non-anginal Pain', 3: 'Asymptomatic'}),
+    ('trestbps', 'Resting Blood Pressure (mm Hg)', None),
+    ('chol', 'Cholesterol (mg/dL)', None),
+    ('fbs', 'High Blood Sugar (>120 mg/dL)', YES_NO_LABELS),
+    ('restecg', 'ECG Results', {0: 'Normal', 1: 'ST-T Wave Abnormality', 2: 'Left Ventricular Hypertrophy'}),
+    ('thalach', 'Maximum Heart Rate', None),
+    ('exang', 'Exercise-Induced Angina', YES_NO_LABELS),
+    ('oldpeak', 'ST Depression', None),
+    ('slope', 'ST Slope', {0: 'Upsloping', 1: 'Flat', 2: 'Downsloping'}),
+    ('ca', 'Major Vessels', None),
+    ('thal', 'Thalassemia', {0: 'Normal', 1: 'Fixed Defect', 2: 'Reversible Defect'})
+)
+
+# DISPLAY_FIELDS with each label pre-rendered as its row's markup prefix
+FIELD_PREFIXES = tuple(
+    (key, f"<b>{label}:</b> ", value_map) for key, label, value_map in DISPLAY_FIELDS
+)
+
+@lru_cache(maxsize=512)
+def report_paragraph(markup, style):
+    """
+    Parse report markup into a Paragraph once per (markup, style). The
+    returned Paragraph is shared and must only be used through copy.copy,
+    since platypus stores layout state on the flowables it builds.
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(markup, style)
+
+# Report text templates; only the risk score or recommendation text varies
+HIGH_RISK_SUMMARY = (
+    "Your heart disease risk assessment shows a <b>HIGH RISK</b> level of %.1f%%. "
+    "This requires immediate attention and medical consultation."
+)
+LOW_RISK_SUMMARY = (
+    "Your heart disease risk assessment shows a <b>LOWER RISK</b> level of %.1f%%. "
+    "While this is positive, maintaining heart health through lifestyle choices is important."
+)
+HIGH_RISK_LEVEL = "<b>Risk Level: HIGH (%.1f%%)</b>"
+LOW_RISK_LEVEL = "<b>Risk Level: LOW TO MODERATE (%.1f%%)</b>"
+CATEGORY_HEADING = "<b>%s</b>"
+BULLET = "• %s"
+
+# Simple daily tips listed near the end of every PDF report
+DAILY_TIPS = (
+    "Take a 30-minute walk every day",
+    "Eat more fruits and vegetables",
+    "Reduce salt in your diet",
+    "Get 7-8 hours of sleep",
+    "Manage stress through relaxation techniques",
+    "Stay hydrated by drinking water",
+    "Limit processed foods and added sugars"
+)
+
+@lru_cache(maxsize=None)
+def get_static_flowables():
+    """
+    Parse the report's constant flowables once per process. They are shared
+    by every ReportGenerator and never built directly: platypus leaves layout
+    state (e.g. _postponed) on the flowables it lays out, so each report works
+    on shallow copies of these.
+    """
+    from reportlab.platypus import Paragraph, Spacer
+
+    title_style, heading_style, body_style, high_risk_style, low_risk_style = get_report_styles()
+
+    title_flowable = Paragraph("Heart Health Assessment Report", title_style)
+    summary_heading = Paragraph("Executive Summary", heading_style)
+
+    # Static explanation paragraphs for each risk branch
+    high_risk_explanation = Paragraph(
+        "What this means: Your assessment indicates a significant risk of heart disease. "
+        "Think of your heart like a car engine showing warning signs - it doesn't mean you're having "
+        "a heart attack right now, but it does mean you need to see a doctor soon to prevent problems.", 
+        body_style
+    )
+    low_risk_explanation = Paragraph(
+        "What this means: Your heart is working well right now, like a car that's running smoothly. "
+        "But just like a car needs regular maintenance, your heart needs ongoing care to stay healthy.", 
+        body_style
+    )
+
+    # Immediate Action Required block, only shown for high risk
+    immediate_action_flowables = (
+        Paragraph("🚨 IMMEDIATE ACTION REQUIRED", heading_style),
+        Paragraph(
+            "<b>Most importantly:</b> Please make an appointment with your doctor or cardiologist "
+            "as soon as possible. Don't wait - early action can save your life.", 
+            body_style
+        ),
+        Paragraph(
+            "<b>Emergency Warning:</b> If you experience chest pain, shortness of breath, or feel like "
+            "something is seriously wrong, call emergency services immediately. Don't wait to see if it gets better.", 
+            body_style
+        ),
+        Spacer(1, 20)
+    )
+
+    # Per-branch report pieces: (summary template, risk level template,
+    # risk level style, flowables following the risk level)
+    high_risk_blocks = (
+        HIGH_RISK_SUMMARY, HIGH_RISK_LEVEL, high_risk_style,
+        (high_risk_explanation, Spacer(1, 20), *immediate_action_flowables)
+    )
+    low_risk_blocks = (
+        LOW_RISK_SUMMARY, LOW_RISK_LEVEL, low_risk_style,
+        (low_risk_explanation, Spacer(1, 20))
+    )
+
+    # Recommendations heading and introduction
+    recommendations_intro = (
+        Paragraph("Your Personalized Health Recommendations", heading_style),
+        Paragraph(
+            "Here's what I recommend you do to improve your heart health:", 
+            body_style
+        )
+    )
+
+    # Lifestyle tips section and disclaimer that close every report
+    closing_flowables = (
+        Spacer(1, 20),
+        Paragraph("Simple Daily Tips for Heart Health", heading_style),
+        Paragraph(
+            "Here are some simple things you can start doing today:", 
+            body_style
+        ),
+        *[Paragraph(f"• {tip}", body_style) for tip in DAILY_TIPS],
+        Spacer(1, 30),
+        Paragraph("Important Medical Disclaimer", heading_style),
+        Paragraph(
+            "This assessment is for informational purposes only and should not replace professional medical advice. "
+            "Your doctor knows you best and can give you personalized advice. Always consult with healthcare "
+            "professionals for medical decisions. Take care of your heart - it's the only one you've got!", 
+            body_style
+        )
+    )
+
+    return (
+        title_flowable, summary_heading, high_risk_blocks, low_risk_blocks,
+        recommendations_intro, closing_flowables
+    )
+
 class ReportGenerator:
     """
     Generate PDF reports with assessment results and recommendations.
     """
+    __slots__ = (
+        'title_style', 'heading_style', 'body_style', 'high_risk_style', 'low_risk_style',
+        'page_templates', 'doc_factory',
+        'title_flowable', 'summary_heading', 'high_risk_blocks', 'low_risk_blocks',
+        'recommendations_intro', 'closing_flowables'
+    )
+
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30
-        )
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12
-        )
-        self.body_style = ParagraphStyle(
-            'CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            spaceAfter=12
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
+
+        (self.title_style, self.heading_style, self.body_style,
+         self.high_risk_style, self.low_risk_style) = get_report_styles()
+
+        # Page setup is the same for every report; only the buffer changes.
+        # The page template and its frame are built once and attached to each
+        # document. A frame carries layout position while a document builds,
+        # so an instance should not build two reports concurrently
+        page_width, page_height = letter
+        self.page_templates = [PageTemplate(
+            id='Report',
+            frames=[Frame(72, 72, page_width - 144, page_height - 144, id='normal')],
+            pagesize=letter
+        )]
+        self.doc_factory = partial(
+            BaseDocTemplate,
+            pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72,
+            pageTemplates=self.page_templates,
+            # Always deflate page streams, and make identical reports produce
+            # identical bytes (fixed creation date and document ID)
+            pageCompression=1,
+            invariant=1
         )
 
-    def generate_report(self, personal_info, risk_score, recommendations):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+        # Constant flowables, parsed once per process and copied per report
+        (self.title_flowable, self.summary_heading, self.high_risk_blocks, self.low_risk_blocks,
+         self.recommendations_intro, self.closing_flowables) = get_static_flowables()
+
+    @staticmethod
+    def generate_reports_batch(jobs, max_workers=None):
+        """
+        Build many PDF reports in parallel worker processes.
+
+        jobs is an iterable of (personal_info, risk_score, recommendations)
+        tuples; the PDFs are returned as a list of bytes in the same order.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(build_report_job, jobs, chunksize=max(1, len(jobs) // 32)))
+
+    def generate_report(self, personal_info, risk_score, recommendations, out_stream=None):
+        """
+        Build the PDF report. When out_stream (any writable binary file-like
+        object) is given the PDF is written straight to it and None is
+        returned; otherwise the PDF is returned as bytes. Callers that want
+        the result without the final bytes copy can pass their own BytesIO
+        and read it through getbuffer().
+        """
+        from reportlab.platypus import Paragraph, Spacer
+
+        buffer = out_stream if out_stream is not None else BytesIO()
+        doc = self.doc_factory(buffer)
         
         # Build the document content
         content = []
         
-        # Title
-        content.append(Paragraph("Heart Health Assessment Report", self.title_style))
-        content.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", self.body_style))
+        # Title; only the timestamp changes between reports
+        content.append(copy.copy(self.title_flowable))
+        content.append(Paragraph(f"Generated on: {report_timestamp()}", self.body_style))
         content.append(Spacer(1, 20))
 
+        # Pick every risk-dependent piece of the report in one branch
+        is_high = risk_score > 50
+        summary, risk_level, risk_level_style, risk_flowables = (
+            self.high_risk_blocks if is_high else self.low_risk_blocks
+        )
+
         # Executive Summary
-        content.append(Paragraph("Executive Summary", self.heading_style))
-        if risk_score > 50:
-            content.append(Paragraph(
-                f"Your heart disease risk assessment shows a <b>HIGH RISK</b> level of {risk_score:.1f}%. "
-                "This requires immediate attention and medical consultation.", 
-                self.body_style
-            ))
-        else:
-            content.append(Paragraph(
-                f"Your heart disease risk assessment shows a <b>LOWER RISK</b> level of {risk_score:.1f}%. "
-                "While this is positive, maintaining heart health through lifestyle choices is important.", 
-                self.body_style
-            ))
+        content.append(copy.copy(self.summary_heading))
+        content.append(Paragraph(summary % risk_score, self.body_style))
         content.append(Spacer(1, 20))
 
         # Personal Information
         content.append(Paragraph("Your Health Information", self.heading_style))
         
-        # Create a more readable format for personal info
-        info_mapping = {
-            'age': 'Age',
-            'sex': 'Sex',
-            'cp': 'Chest Pain Type',
-            'trestbps': 'Resting Blood Pressure (mm Hg)',
-            'chol': 'Cholesterol (mg/dL)',
-            'fbs': 'High Blood Sugar (>120 mg/dL)',
-            'restecg': 'ECG Results',
-            'thalach': 'Maximum Heart Rate',
-            'exang': 'Exercise-Induced Angina',
-            'oldpeak': 'ST Depression',
-            'slope': 'ST Slope',
-            'ca': 'Major Vessels',
-            'thal': 'Thalassemia'
-        }
-        
-        # Value mappings for better readability
-        value_mappings = {
-            'sex': {0: 'Female', 1: 'Male'},
-            'cp': {0: 'Typical Angina', 1: 'Atypical Angina', 2: 'Non-anginal Pain', 3: 'Asymptomatic'},
-            'fbs': {0: 'No', 1: 'Yes'},
-            'restecg': {0: 'Normal', 1: 'ST-T Wave Abnormality', 2: 'Left Ventricular Hypertrophy'},
-            'exang': {0: 'No', 1: 'Yes'},
-            'slope': {0: 'Upsloping', 1: 'Flat', 2: 'Downsloping'},
-            'thal': {0: 'Normal', 1: 'Fixed Defect', 2: 'Reversible Defect'}
-        }
-        
-        for key, value in personal_info.items():
-            if key in info_mapping:
-                display_key = info_mapping[key]
-                if key in value_mappings:
-                    display_value = value_mappings[key].get(value, str(value))
-                else:
-                    display_value = str(value)
-                content.append(Paragraph(f"<b>{display_key}:</b> {display_value}", self.body_style))
+        for key, prefix, value_map in FIELD_PREFIXES:
+            value = personal_info.get(key)
+            if value is None:
+                continue
+            display_value = value_map.get(value, value) if value_map else value
+            content.append(Paragraph(prefix + escape(str(display_value)), self.body_style))
         content.append(Spacer(1, 20))
 
-        # Risk Assessment with Explanation
+        # Risk Assessment with Explanation, plus Immediate Action Required for high risk
         content.append(Paragraph("Understanding Your Risk Assessment", self.heading_style))
-        
-        if risk_score > 50:
-            content.append(Paragraph(
-                f"<b>Risk Level: HIGH ({risk_score:.1f}%)</b>", 
-                ParagraphStyle('HighRisk', parent=self.body_style, textColor='red', fontSize=14)
-            ))
-            content.append(Paragraph(
-                "What this means: Your assessment indicates a significant risk of heart disease. "
-                "Think of your heart like a car engine showing warning signs - it doesn't mean you're having "
-                "a heart attack right now, but it does mean you need to see a doctor soon to prevent problems.", 
-                self.body_style
-            ))
-        else:
-            content.append(Paragraph(
-                f"<b>Risk Level: LOW TO MODERATE ({risk_score:.1f}%)</b>", 
-                ParagraphStyle('LowRisk', parent=self.body_style, textColor='green', fontSize=14)
-            ))
-            content.append(Paragraph(
-                "What this means: Your heart is working well right now, like a car that's running smoothly. "
-                "But just like a car needs regular maintenance, your heart needs ongoing care to stay healthy.", 
-                self.body_style
-            ))
-        content.append(Spacer(1, 20))
-
-        # Immediate Action Required
-        if risk_score > 50:
-            content.append(Paragraph("🚨 IMMEDIATE ACTION REQUIRED", self.heading_style))
-            content.append(Paragraph(
-                "<b>Most importantly:</b> Please make an appointment with your doctor or cardiologist "
-                "as soon as possible. Don't wait - early action can save your life.", 
-                self.body_style
-            ))
-            content.append(Paragraph(
-                "<b>Emergency Warning:</b> If you experience chest pain, shortness of breath, or feel like "
-                "something is seriously wrong, call emergency services immediately. Don't wait to see if it gets better.", 
-                self.body_style
-            ))
-            content.append(Spacer(1, 20))
+        content.append(Paragraph(risk_level % risk_score, risk_level_style))
+        content.extend(map(copy.copy, risk_flowables))
 
         # Recommendations
-        content.append(Paragraph("Your Personalized Health Recommendations", self.heading_style))
-        content.append(Paragraph(
-            "Here's what I recommend you do to improve your heart health:", 
-            self.body_style
-        ))
+        content.extend(map(copy.copy, self.recommendations_intro))
         
+        # Recommendation text comes from a fixed set of strings, so each
+        # card's paragraphs are parsed once per process and copied after that.
+        # Text values are escaped so they can never be read as markup
+        body_style = self.body_style
         for rec in recommendations:
-            content.append(Paragraph(f"<b>{rec['category']}</b>", self.heading_style))
-            content.append(Paragraph(rec['advice'], self.body_style))
-            for step in rec['steps']:
-                content.append(Paragraph(f"• {step}", self.body_style))
-            content.append(Spacer(1, 10))
-
-        # Lifestyle Tips Section
-        content.append(Spacer(1, 20))
-        content.append(Paragraph("Simple Daily Tips for Heart Health", self.heading_style))
-        content.append(Paragraph(
-            "Here are some simple things you can start doing today:", 
-            self.body_style
-        ))
-        
-        daily_tips = [
-            "Take a 30-minute walk every day",
-            "Eat more fruits and vegetables",
-            "Reduce salt in your diet",
-            "Get 7-8 hours of sleep",
-            "Manage stress through relaxation techniques",
-            "Stay hydrated by drinking water",
-            "Limit processed foods and added sugars"
-        ]
-        
-        for tip in daily_tips:
-            content.append(Paragraph(f"• {tip}", self.body_style))
+            content.extend([
+                copy.copy(report_paragraph(CATEGORY_HEADING % escape(rec['category']), self.heading_style)),
+                copy.copy(report_paragraph(escape(rec['advice']), body_style)),
+                *[copy.copy(report_paragraph(BULLET % escape(step), body_style)) for step in rec['steps']],
+                Spacer(1, 10)
+            ])
 
-        # Important Disclaimer
-        content.append(Spacer(1, 30))
-        content.append(Paragraph("Important Medical Disclaimer", self.heading_style))
-        content.append(Paragraph(
-            "This assessment is for informational purposes only and should not replace professional medical advice. "
-            "Your doctor knows you best and can give you personalized advice. Always consult with healthcare "
-            "professionals for medical decisions. Take care of your heart - it's the only one you've got!", 
-            self.body_style
-        ))
+        # Lifestyle Tips Section and Important Disclaimer
+        content.extend(map(copy.copy, self.closing_flowables))
 
         # Build and return the PDF
         doc.build(content)
-        buffer.seek(0)
-        return buffer.getvalue() 
\ No newline at end of file
+        if out_stream is not None:
+            return None
+        return buffer.getvalue() 
+
+@lru_cache(maxsize=1)
+def worker_report_generator():
+    """
+    One ReportGenerator per worker process, created on first use there.
+    """
+    return ReportGenerator()
+
+def build_report_job(job):
+    """
+    Worker entry point for ReportGenerator.generate_reports_batch.
+    """
+    personal_info, risk_score, recommendations = job
+    return worker_report_generator().generate_report(personal_info, risk_score, recommendations)